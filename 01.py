@@ -1,32 +1,70 @@
-from collections.abc import Iterable, Iterator
+import re
+from collections.abc import Buffer, Iterable
+
+from aoc import load
 
 WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
 
+DIGITS = {str(num).encode(): num for num in range(1, 10)}
+SPELLED = DIGITS | {w.encode(): num for num, w in enumerate(WORDS, start=1)}
+
+
+class Scanner:
+    """Find the first and last digit in a line, in a single pass from each end.
+
+    The digits are matched by one regex alternation, which tries a constant
+    number of (short) alternatives at each position, and so runs in linear
+    time. The last digit is the first match of the reversed alternation in
+    the reversed line, so overlapping words ("oneight") are handled, and
+    neither scan goes further into the line than needed.
+    """
 
-def digits(s: str, *, spelled: bool = False) -> Iterator[int]:
-    digits = {str(d): d for d in range(1, 10)}
-    if spelled:
-        digits |= {word: num for num, word in enumerate(WORDS, start=1)}
-    while s:
-        for k, v in digits.items():
-            if s.startswith(k):
-                yield v
-        s = s[1:]
+    def __init__(self, digits: dict[bytes, int]) -> None:
+        self.digits = digits | {word[::-1]: num for word, num in digits.items()}
+        self.forward = re.compile(b"|".join(map(re.escape, digits)))
+        self.backward = re.compile(
+            b"|".join(re.escape(word[::-1]) for word in digits)
+        )
 
+    def first_and_last(self, line: bytes) -> int:
+        first = self.forward.search(line)
+        last = self.backward.search(line[::-1])
+        assert first is not None
+        assert last is not None
+        return self.digits[first[0]] * 10 + self.digits[last[0]]
 
-def first_and_last_digits(digits: Iterable[int]) -> int:
-    it = iter(digits)
-    first = last = next(it)
-    for item in it:
-        last = item
-    return first * 10 + last
 
+PLAIN_SCANNER = Scanner(DIGITS)
+SPELLED_SCANNER = Scanner(SPELLED)
+
+
+def parse(text: load.Input) -> list[bytes]:
+    return bytes(load.as_bytes(text)).splitlines()
 
-with open("01.input") as f:
-    lines = list(f)
 
 # Part 1: What is the sum of all of the calibration values?
-print(sum(first_and_last_digits(digits(line)) for line in lines))
+def part1(lines: list[bytes]) -> int:
+    return sum(map(PLAIN_SCANNER.first_and_last, lines))
+
 
 # Part 2: What is the sum of calibration values (incl. spelled-out digits)?
-print(sum(first_and_last_digits(digits(line, spelled=True)) for line in lines))
+def part2(lines: list[bytes]) -> int:
+    return sum(map(SPELLED_SCANNER.first_and_last, lines))
+
+
+def stream(lines: Iterable[Buffer]) -> tuple[int, int]:
+    """Solve both parts in one pass, holding only one line at a time."""
+    plain = spelled = 0
+    for raw in lines:
+        line = bytes(raw)
+        plain += PLAIN_SCANNER.first_and_last(line)
+        spelled += SPELLED_SCANNER.first_and_last(line)
+    return plain, spelled
+
+
+def solve(text: load.Input) -> tuple[int, int]:
+    return stream(load.lines(load.as_bytes(text)))
+
+
+if __name__ == "__main__":
+    load.main_parallel(stream, "01.input")
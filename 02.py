@@ -1,72 +1,128 @@
-from dataclasses import dataclass
-from typing import Self
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Buffer, Iterable, Sequence
+from dataclasses import dataclass, field
+from itertools import batched, compress, repeat
+from math import prod
+from operator import le
 
+from aoc import load
+from aoc.fenwick import Fenwick2D
+
+Color = bytes
+Cubes = dict[Color, int]
+Limit = tuple[int, int, int]  # red, green, blue
+
+COLORS: list[Color] = [b"red", b"green", b"blue"]
+LIMIT: Cubes = {b"red": 12, b"green": 13, b"blue": 14}
 
-@dataclass
-class Cubes:
-    red: int = 0
-    green: int = 0
-    blue: int = 0
-
-    @classmethod
-    def parse(cls, s: str) -> Self:
-        """'6 red, 1 blue' -> Cubes(red=5, green=0, blue=1)."""
-        ret = cls()
-        for part in s.split(","):
-            num, color = part.split()
-            assert color in {"red", "green", "blue"}
-            setattr(ret, color, int(num))
-        return ret
-
-    def possible(self, limit: Self) -> bool:
-        """Test if this set of cubes is a subset of the given the limit."""
-        return (
-            self.red <= limit.red
-            and self.green <= limit.green
-            and self.blue <= limit.blue
-        )
-
-    def power(self) -> int:
-        return self.red * self.green * self.blue
+
+def parse_game(line: bytes) -> tuple[int, Cubes]:
+    """Parse a game's ID, and the most cubes of each color shown at once.
+
+    Input: b"Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green"
+    Output: (1, {b"red": 4, b"green": 2, b"blue": 6})
+    """
+    assert line.startswith(b"Game ")
+    intro, draws = line.split(b":", maxsplit=1)
+    most = dict.fromkeys(COLORS, 0)
+    for num, color in batched(draws.translate(None, b",;").split(), 2):
+        most[color] = max(most[color], int(num))
+    return int(intro[5:]), most
 
 
 @dataclass
-class Game:
-    id: int  # noqa: A003
-    draws: list[Cubes]
-
-    @classmethod
-    def parse(cls, line: str) -> Self:
-        """Parse game from line.
-
-        Input: "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green"
-        Output: Game(id=1, draws=[Cubes(4, 0, 3), Cubes(1, 2, 6), Cubes(0, 2)])
-        """
-        assert line.startswith("Game ")
-        intro, draws = line.split(":", maxsplit=1)
-        return cls(
-            id=int(intro[5:]),
-            draws=[Cubes.parse(s) for s in draws.split(";")],
-        )
-
-    def possible(self, limit: Cubes) -> bool:
-        """Test if this game is possible, within the given the limit."""
-        return all(draw.possible(limit) for draw in self.draws)
-
-    def min_cubes(self) -> Cubes:
-        """Least number of cubes needed for this game."""
-        return Cubes(
-            red=max(d.red for d in self.draws),
-            green=max(d.green for d in self.draws),
-            blue=max(d.blue for d in self.draws),
-        )
-
-
-with open("02.input") as f:
-    games = [Game.parse(line) for line in f]
+class Games:
+    """Game IDs, and the most cubes of each color per game, as int columns."""
+
+    ids: array[int] = field(default_factory=lambda: array("q"))
+    most: dict[Color, array[int]] = field(
+        default_factory=lambda: {color: array("q") for color in COLORS}
+    )
+
+    def add(self, line: bytes) -> None:
+        game_id, most = parse_game(line)
+        self.ids.append(game_id)
+        for color in COLORS:
+            self.most[color].append(most[color])
+
+
+def possible_id_sums(games: Games, limits: Sequence[Limit]) -> list[int]:
+    """Return the sum of the IDs of the possible games, for each limit.
+
+    A game is possible iff its most cubes of each color are within the limit,
+    which makes each limit a 3-D dominance query. We answer them all in one
+    sweep, in order of increasing red: first adding the games with no more red
+    cubes than the current limit to a 2-D Fenwick tree over (green, blue), and
+    then summing the IDs in its green/blue prefix. That costs O(log^2 games)
+    per game and per limit, instead of O(games) per limit.
+    """
+    red, green, blue = (games.most[color] for color in COLORS)
+    greens, blues = sorted(set(green)), sorted(set(blue))  # tree coordinates
+    tree = Fenwick2D(len(greens), len(blues))
+    by_red = sorted(range(len(games.ids)), key=red.__getitem__)
+    added = 0
+    sums = [0] * len(limits)
+    for q in sorted(range(len(limits)), key=lambda q: limits[q][0]):
+        max_red, max_green, max_blue = limits[q]
+        while added < len(by_red) and red[by_red[added]] <= max_red:
+            game = by_red[added]
+            x = bisect_left(greens, green[game])
+            y = bisect_left(blues, blue[game])
+            tree.add(x, y, games.ids[game])
+            added += 1
+        x = bisect_right(greens, max_green)
+        y = bisect_right(blues, max_blue)
+        sums[q] = tree.prefix_sum(x, y)
+    return sums
+
+
+def parse(text: load.Input) -> Games:
+    games = Games()
+    for line in load.lines(load.as_bytes(text)):
+        games.add(bytes(line))
+    return games
+
 
 # Part 1: Sum of possible Game IDs
-print(sum(game.id for game in games if game.possible(limit=Cubes(12, 13, 14))))
+def part1(games: Games) -> int:
+    fits = [
+        map(le, games.most[color], repeat(LIMIT[color])) for color in COLORS
+    ]
+    return sum(compress(games.ids, map(all, zip(*fits, strict=True))))
+
+
+# Part 2: Sum of powers across all minimum sets of cubes in these games
+def part2(games: Games) -> int:
+    return sum(map(prod, zip(*games.most.values(), strict=True)))
+
+
+def stream(lines: Iterable[Buffer]) -> tuple[int, int]:
+    """Solve both parts in one pass, holding only one game at a time."""
+    ids = powers = 0
+    for line in lines:
+        game_id, most = parse_game(bytes(line))
+        if all(most[color] <= LIMIT[color] for color in COLORS):
+            ids += game_id
+        powers += prod(most.values())
+    return ids, powers
+
+
+def checked(lines: Iterable[Buffer]) -> tuple[int, int]:
+    """Solve both parts from the columns, cross-checking possible_id_sums()."""
+    games = Games()
+    for line in lines:
+        games.add(bytes(line))
+    possible = part1(games)
+    limit = (LIMIT[b"red"], LIMIT[b"green"], LIMIT[b"blue"])
+    assert possible_id_sums(games, [limit]) == [possible]
+    return possible, part2(games)
+
+
+def solve(text: load.Input) -> tuple[int, int]:
+    return stream(load.lines(load.as_bytes(text)))
+
 
-# Part 2: Sum of powers across all minimum sets of cubes in these games.
-print(sum(game.min_cubes().power() for game in games))
+if __name__ == "__main__":
+    # The cross-check holds all games in memory; skip it under python -O.
+    load.main_stream(checked if __debug__ else stream, "02.input")
@@ -1,64 +1,72 @@
 from collections.abc import Iterator
-from itertools import takewhile
-from typing import NamedTuple, Self, cast
+from typing import NamedTuple, cast
 
-
-class Point(NamedTuple):
-    y: int
-    x: int
-
-    def left(self) -> Self:
-        return self.__class__(self.y, self.x - 1)
-
-    def nbors(self) -> set[Self]:
-        return {
-            self.__class__(y, x)
-            for y in [self.y - 1, self.y, self.y + 1]
-            for x in [self.x - 1, self.x, self.x + 1]
-            if not (y == self.y and x == self.x)
-        }
+from aoc import load
+from aoc.grid import Grid
 
 
 class Part(NamedTuple):
-    p: Point
+    pos: int  # position of first digit
     digits: str
 
-    def points(self) -> set[Point]:
-        return {Point(self.p.y, self.p.x + x) for x in range(len(self.digits))}
-
     def number(self) -> int:
         return int(self.digits)
 
 
-symbols: dict[Point, str] = {}
-pmap: dict[Point, Part] = {}
-with open("03.input") as f:
-    digits: set[Point] = set()
-    for y, line in enumerate(f):
-        for x, c in enumerate(line.rstrip()):
-            p = Point(y, x)
-            if c.isdigit():
-                digits.add(p)
-                if p.left() not in digits:
-                    adj_digits = takewhile(lambda c: c.isdigit(), line[x:])
-                    part = Part(p, "".join(adj_digits))
-                    for pp in part.points():
-                        pmap[pp] = part
-            elif c != ".":
-                symbols[p] = c
+Schematic = tuple[Grid, dict[int, Part]]  # grid, part at each digit position
 
 
-# Part 1: Sum of all of the part numbers in the engine schematic?
-parts = {pmap[p] for sym in symbols for p in sym.nbors() if p in pmap}
-print(sum(part.number() for part in parts))
+def symbols(grid: Grid) -> Iterator[int]:
+    for pos in grid.positions():
+        if grid[pos] not in ".0123456789":
+            yield pos
 
 
-# Part 2: Sum of all of the gear ratios in your engine schematic?
-def geared_parts() -> Iterator[tuple[Part, Part]]:
-    for gear in {p for p, c in symbols.items() if c == "*"}:
-        connected = {pmap[nb] for nb in gear.nbors() if nb in pmap}
+def adjacent_parts(schematic: Schematic, pos: int) -> set[Part]:
+    grid, pmap = schematic
+    return {pmap[pos + d] for d in grid.dirs8 if pos + d in pmap}
+
+
+def geared_parts(schematic: Schematic) -> Iterator[tuple[Part, Part]]:
+    grid, _ = schematic
+    for gear in grid.find("*"):
+        connected = adjacent_parts(schematic, gear)
         if len(connected) == 2:
             yield cast(tuple[Part, Part], tuple(connected))
 
 
-print(sum(a.number() * b.number() for a, b in geared_parts()))
+def parse(text: str) -> Schematic:
+    grid = Grid.parse(text, border=".")
+    pmap: dict[int, Part] = {}
+    for pos in grid.positions():
+        if grid[pos].isdigit() and not grid[pos - 1].isdigit():
+            end = pos + 1
+            while grid[end].isdigit():  # the border stops this
+                end += 1
+            part = Part(pos, grid.cells[pos:end].decode())
+            for p in range(pos, end):
+                pmap[p] = part
+    return grid, pmap
+
+
+# Part 1: Sum of all of the part numbers in the engine schematic?
+def part1(schematic: Schematic) -> int:
+    grid, _ = schematic
+    parts = set()
+    for sym in symbols(grid):
+        parts |= adjacent_parts(schematic, sym)
+    return sum(part.number() for part in parts)
+
+
+# Part 2: Sum of all of the gear ratios in your engine schematic?
+def part2(schematic: Schematic) -> int:
+    return sum(a.number() * b.number() for a, b in geared_parts(schematic))
+
+
+def solve(text: str) -> tuple[int, int]:
+    schematic = parse(text)
+    return part1(schematic), part2(schematic)
+
+
+if __name__ == "__main__":
+    load.main(solve, "03.input")
@@ -1,23 +1,26 @@
+from collections import deque
+from collections.abc import Buffer, Iterable
 from dataclasses import dataclass
 from typing import Self
 
+from aoc import load
+
 
 @dataclass
 class Card:
     id: int  # noqa: A003
     winning: set[int]
     have: set[int]
-    instances: int = 1
 
     @classmethod
-    def parse(cls, line: str) -> Self:
-        assert line.startswith("Card ")
-        intro, rest = line.split(":")
-        winning, have = rest.split("|")
+    def parse(cls, line: bytes) -> Self:
+        assert line.startswith(b"Card ")
+        intro, rest = line.split(b":")
+        winning, have = rest.split(b"|")
         return cls(
-            id=int(intro.split()[-1]),
-            winning={int(word) for word in winning.split()},
-            have={int(word) for word in have.split()},
+            id=load.ints(intro)[0],
+            winning=set(load.ints(winning)),
+            have=set(load.ints(have)),
         )
 
     def wins(self) -> set[int]:
@@ -28,14 +31,47 @@ class Card:
         return int(2 ** (num_wins - 1)) if num_wins else 0
 
 
-with open("04.input") as f:
-    cards = [Card.parse(line) for line in f]
+def parse(text: load.Input) -> list[Card]:
+    return [Card.parse(bytes(ln)) for ln in load.lines(load.as_bytes(text))]
+
 
 # Part 1: How many points are the cards worth in total?
-print(sum(card.points() for card in cards))
+def part1(cards: list[Card]) -> int:
+    return sum(card.points() for card in cards)
+
 
 # Part 2: How many total scratchcards do you end up with?
-for card in cards:
-    for ncard in cards[card.id : card.id + len(card.wins())]:
-        ncard.instances += card.instances
-print(sum(card.instances for card in cards))
+def part2(cards: list[Card]) -> int:
+    instances = {card.id: 1 for card in cards}
+    for card in cards:
+        for ncard in cards[card.id : card.id + len(card.wins())]:
+            instances[ncard.id] += instances[card.id]
+    return sum(instances.values())
+
+
+def stream(lines: Iterable[Buffer]) -> tuple[int, int]:
+    """Solve both parts in one pass, holding only one card at a time.
+
+    A card only ever wins copies of the next few cards, so for part 2 we
+    keep a sliding window with the number of copies won for each of them.
+    """
+    points = total = 0
+    copies: deque[int] = deque()  # copies won of the cards following this one
+    for line in lines:
+        card = Card.parse(bytes(line))
+        points += card.points()
+        instances = 1 + (copies.popleft() if copies else 0)
+        total += instances
+        num_wins = len(card.wins())
+        copies.extend([0] * (num_wins - len(copies)))
+        for i in range(num_wins):
+            copies[i] += instances
+    return points, total
+
+
+def solve(text: load.Input) -> tuple[int, int]:
+    return stream(load.lines(load.as_bytes(text)))
+
+
+if __name__ == "__main__":
+    load.main_stream(stream, "04.input")
@@ -1,5 +1,7 @@
 from math import ceil, floor, prod, sqrt
 
+from aoc import load
+
 
 def break_record(race_time: int, record: int) -> tuple[int, int]:
     """Return lower/upper bound for charge time that will break record.
@@ -15,21 +17,34 @@ def count_record_breaks(race_time: int, record: int) -> int:
     return upper + 1 - lower
 
 
-with open("06.input") as f:
-    first = f.readline()
+def parse(text: str) -> tuple[str, str]:
+    first, second, *_ = text.splitlines()
     assert first.startswith("Time:")
-    second = f.readline()
     assert second.startswith("Distance:")
+    return first.split(":")[1], second.split(":")[1]
+
 
 # Part 1: Product of the number of ways to beat the record in each race
-times = [int(num) for num in first.split(":")[1].split()]
-records = [int(num) for num in second.split(":")[1].split()]
-races = zip(times, records, strict=True)
-print(
-    prod(count_record_breaks(race_time, record) for race_time, record in races)
-)
-
-# Part 2: One bug race
-time = int(first.split(":")[1].replace(" ", ""))
-record = int(second.split(":")[1].replace(" ", ""))
-print(count_record_breaks(time, record))
+def part1(sheet: tuple[str, str]) -> int:
+    times = [int(num) for num in sheet[0].split()]
+    records = [int(num) for num in sheet[1].split()]
+    races = zip(times, records, strict=True)
+    return prod(
+        count_record_breaks(race_time, record) for race_time, record in races
+    )
+
+
+# Part 2: One big race
+def part2(sheet: tuple[str, str]) -> int:
+    time = int(sheet[0].replace(" ", ""))
+    record = int(sheet[1].replace(" ", ""))
+    return count_record_breaks(time, record)
+
+
+def solve(text: str) -> tuple[int, int]:
+    sheet = parse(text)
+    return part1(sheet), part2(sheet)
+
+
+if __name__ == "__main__":
+    load.main(solve, "06.input")
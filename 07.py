@@ -4,6 +4,8 @@ from enum import IntEnum
 from functools import total_ordering
 from typing import Self
 
+from aoc import load
+
 
 class Card(IntEnum):
     JOKER = 1
@@ -21,17 +23,13 @@ class Card(IntEnum):
     K = 13
     A = 14
 
-    @classmethod
-    def parse(cls, c: str) -> Self:
-        try:
-            return cls.__members__[c]
-        except KeyError:
-            return cls.__members__["_" + c]
-
     def __str__(self) -> str:
         return self.name.lstrip("_")
 
 
+CARDS = {ord(str(card)): card for card in Card if card != Card.JOKER}  # by byte
+
+
 @total_ordering
 @dataclass(frozen=True)
 class Hand:
@@ -39,9 +37,9 @@ class Hand:
     bid: int
 
     @classmethod
-    def parse(cls, line: str) -> Self:
+    def parse(cls, line: bytes) -> Self:
         cards, bid = line.split()
-        return cls(tuple(Card.parse(c) for c in cards), int(bid))
+        return cls(tuple(CARDS[c] for c in cards), int(bid))
 
     def with_jokers(self) -> Self:
         """Convert this hand from J -> JOKER."""
@@ -81,13 +79,26 @@ class Hand:
         )
 
 
-with open("07.input") as f:
-    hands = [Hand.parse(line) for line in f]
+def parse(text: load.Input) -> list[Hand]:
+    return [Hand.parse(bytes(ln)) for ln in load.lines(load.as_bytes(text))]
+
 
 # Part 1: What are the total winnings from the given hands?
-hands.sort()
-print(sum(hand.bid * rank for rank, hand in enumerate(hands, start=1)))
+def part1(hands: list[Hand]) -> int:
+    ranked = sorted(hands)
+    return sum(hand.bid * rank for rank, hand in enumerate(ranked, start=1))
+
 
 # Part 2: What are the total winnings from the given hands with J -> Joker?
-hands = sorted(hand.with_jokers() for hand in hands)
-print(sum(hand.bid * rank for rank, hand in enumerate(hands, start=1)))
+def part2(hands: list[Hand]) -> int:
+    ranked = sorted(hand.with_jokers() for hand in hands)
+    return sum(hand.bid * rank for rank, hand in enumerate(ranked, start=1))
+
+
+def solve(text: load.Input) -> tuple[int, int]:
+    hands = parse(text)
+    return part1(hands), part2(hands)
+
+
+if __name__ == "__main__":
+    load.main_raw(solve, "07.input")
@@ -2,10 +2,17 @@ from collections.abc import Callable, Iterator
 from itertools import cycle
 from math import lcm
 
-with open("08.input") as f:
-    recipe = [{"L": 0, "R": 1}[c] for c in f.readline().strip()]
+from aoc import load
+
+Nodes = dict[str, tuple[str, str]]
+Network = tuple[list[int], Nodes]  # recipe, nodes
+
+
+def parse(text: str) -> Network:
+    first, *lines = text.splitlines()
+    recipe = [{"L": 0, "R": 1}[c] for c in first.strip()]
     nodes = {}
-    for line in f:
+    for line in lines:
         if not line.strip():
             continue
         node, children = line.split("=")
@@ -13,10 +20,14 @@ with open("08.input") as f:
         assert child1.startswith("(")
         assert child2.endswith(")")
         nodes[node.strip()] = (child1[1:].strip(), child2[:-1].strip())
+    return recipe, nodes
 
 
 def steps_until(
-    instructions: Iterator[int], start: str, pred: Callable[[str], bool]
+    nodes: Nodes,
+    instructions: Iterator[int],
+    start: str,
+    pred: Callable[[str], bool],
 ) -> tuple[str, int]:
     """Traverse nodes from start following instructions until pred is True."""
     current = start
@@ -27,12 +38,14 @@ def steps_until(
     return current, steps
 
 
-def period(start: str, pred: Callable[[str], bool]) -> Iterator[int]:
+def period(
+    nodes: Nodes, recipe: list[int], start: str, pred: Callable[[str], bool]
+) -> Iterator[int]:
     instructions = cycle(recipe)
     current = start
     total = 0
     while True:
-        current, steps = steps_until(instructions, current, pred)
+        current, steps = steps_until(nodes, instructions, current, pred)
         total += steps
         yield total
         if total % len(recipe) == 0:  # found period
@@ -40,13 +53,28 @@ def period(start: str, pred: Callable[[str], bool]) -> Iterator[int]:
 
 
 # Part 1: How many steps are required to reach ZZZ?
-print(steps_until(cycle(recipe), "AAA", lambda node: node == "ZZZ")[1])
+def part1(network: Network) -> int:
+    recipe, nodes = network
+    _, steps = steps_until(nodes, cycle(recipe), "AAA", lambda n: n == "ZZZ")
+    return steps
+
 
 # Part 2: How many steps before you're only on nodes that end with Z?
-a_nodes = {node for node in nodes if node.endswith("A")}
-periods = {
-    a_node: list(period(a_node, lambda node: node.endswith("Z")))
-    for a_node in a_nodes
-}
-assert all(len(p) == 1 for p in periods.values())
-print(lcm(*[p[0] for p in periods.values()]))
+def part2(network: Network) -> int:
+    recipe, nodes = network
+    a_nodes = {node for node in nodes if node.endswith("A")}
+    periods = {
+        a_node: list(period(nodes, recipe, a_node, lambda n: n.endswith("Z")))
+        for a_node in a_nodes
+    }
+    assert all(len(p) == 1 for p in periods.values())
+    return lcm(*[p[0] for p in periods.values()])
+
+
+def solve(text: str) -> tuple[int, int]:
+    network = parse(text)
+    return part1(network), part2(network)
+
+
+if __name__ == "__main__":
+    load.main(solve, "08.input")
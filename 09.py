@@ -1,4 +1,6 @@
-from collections.abc import Iterable, Iterator
+from collections.abc import Buffer, Iterable, Iterator
+
+from aoc import load
 
 
 def derivative(seq: Iterable[int]) -> Iterator[int]:
@@ -15,11 +17,33 @@ def next_value(seq: list[int]) -> int:
     return seq[-1] + next_value(list(derivative(seq)))
 
 
-with open("09.input") as f:
-    sequences = [[int(n) for n in line.split()] for line in f]
+def parse(text: load.Input) -> list[list[int]]:
+    return [load.ints(line) for line in load.lines(load.as_bytes(text))]
+
 
 # Part 1: What is the sum of these extrapolated values?
-print(sum(next_value(seq) for seq in sequences))
+def part1(sequences: list[list[int]]) -> int:
+    return sum(next_value(seq) for seq in sequences)
+
 
 # Part 2: What is the sum of these extrapolated values, going the other way?
-print(sum(next_value(list(reversed(seq))) for seq in sequences))
+def part2(sequences: list[list[int]]) -> int:
+    return sum(next_value(list(reversed(seq))) for seq in sequences)
+
+
+def stream(lines: Iterable[Buffer]) -> tuple[int, int]:
+    """Solve both parts in one pass, holding only one sequence at a time."""
+    forward = backward = 0
+    for line in lines:
+        seq = load.ints(line)
+        forward += next_value(seq)
+        backward += next_value(seq[::-1])
+    return forward, backward
+
+
+def solve(text: load.Input) -> tuple[int, int]:
+    return stream(load.lines(load.as_bytes(text)))
+
+
+if __name__ == "__main__":
+    load.main_stream(stream, "09.input")
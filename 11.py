@@ -1,37 +1,52 @@
 from bisect import bisect_left
 from collections.abc import Iterator
 from itertools import combinations
-from typing import NamedTuple, Self
 
+from aoc import load
+from aoc.grid import Grid
 
-class Coord(NamedTuple):
-    y: int
-    x: int
+Coord = tuple[int, int]
 
-    def mgdist(self, other: Self) -> int:
-        return abs(self.y - other.y) + abs(self.x - other.x)
 
+def mgdist(a: Coord, b: Coord) -> int:
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-def parse(lines: list[str], expansion: int) -> Iterator[Coord]:
-    xlen = max(len(line) for line in lines)
-    empty_y = [i for i, line in enumerate(lines) if all(c == "." for c in line)]
-    empty_x = [i for i in range(xlen) if all(line[i] == "." for line in lines)]
-    for y, line in enumerate(lines):
-        for x, c in enumerate(line):
-            if c == "#":
-                yield Coord(
-                    y + bisect_left(empty_y, y) * (expansion - 1),
-                    x + bisect_left(empty_x, x) * (expansion - 1),
-                )
 
+def expanded_galaxies(grid: Grid, expansion: int) -> Iterator[Coord]:
+    empty_y = [y for y in range(grid.height) if b"#" not in grid.row(y)]
+    empty_x = [
+        x
+        for x in range(grid.width)
+        if b"#" not in grid.cells[grid.pos(0, x) :: grid.stride]
+    ]
+    for pos in grid.find("#"):
+        y, x = grid.yx(pos)
+        yield (
+            y + bisect_left(empty_y, y) * (expansion - 1),
+            x + bisect_left(empty_x, x) * (expansion - 1),
+        )
+
+
+def parse(text: str) -> Grid:
+    return Grid.parse(text, border=".")
 
-with open("11.input") as f:
-    lines = [line.rstrip() for line in f]
 
 # Part 1: What is the sum of shortest distances between all galaxies?
-galaxies = list(parse(lines, expansion=2))
-print(sum(a.mgdist(b) for a, b in combinations(galaxies, 2)))
+def part1(grid: Grid) -> int:
+    galaxies = list(expanded_galaxies(grid, expansion=2))
+    return sum(mgdist(a, b) for a, b in combinations(galaxies, 2))
+
 
 # Part 2: What is the sum of shortest distances between all older galaxies?
-galaxies = list(parse(lines, expansion=1_000_000))
-print(sum(a.mgdist(b) for a, b in combinations(galaxies, 2)))
+def part2(grid: Grid) -> int:
+    galaxies = list(expanded_galaxies(grid, expansion=1_000_000))
+    return sum(mgdist(a, b) for a, b in combinations(galaxies, 2))
+
+
+def solve(text: str) -> tuple[int, int]:
+    grid = parse(text)
+    return part1(grid), part2(grid)
+
+
+if __name__ == "__main__":
+    load.main(solve, "11.input")
@@ -1,14 +1,15 @@
-from functools import cache
+from aoc import load
+from aoc.memo import memo, reset_scope
 
 Groups = tuple[int, ...]
 
 
-def parse(line: str) -> tuple[str, Groups]:
+def parse_line(line: str) -> tuple[str, Groups]:
     s, groups = line.split()
     return s, tuple(int(n) for n in groups.split(","))
 
 
-@cache
+@memo(scope="line")
 def count_alternatives(clusters: tuple[str, ...], groups: Groups) -> int:
     if not groups:
         # We're out of required springs. This is only a valid alternative iff
@@ -48,6 +49,7 @@ def count_alternatives(clusters: tuple[str, ...], groups: Groups) -> int:
 
 
 def num_matching_springs(input: str, groups: Groups) -> int:
+    reset_scope("line")  # lines rarely share subproblems, keep the cache small
     return count_alternatives(tuple(s for s in input.split(".") if s), groups)
 
 
@@ -56,12 +58,25 @@ def unfold(springs: tuple[str, Groups], times: int) -> tuple[str, Groups]:
     return "?".join([s] * times), nums * times
 
 
-with open("12.input") as f:
-    springs = [parse(line) for line in f]
+def parse(text: str) -> list[tuple[str, Groups]]:
+    return [parse_line(line) for line in text.splitlines()]
+
 
 # Part 1: What is the sum of counts of all the different good arrangements?
-print(sum(num_matching_springs(s, groups) for s, groups in springs))
+def part1(springs: list[tuple[str, Groups]]) -> int:
+    return sum(num_matching_springs(s, groups) for s, groups in springs)
+
 
 # Part 2: What is the sum of counts of all the unfolded good arrangements?
-springs = [unfold(s, 5) for s in springs]
-print(sum(num_matching_springs(s, groups) for s, groups in springs))
+def part2(springs: list[tuple[str, Groups]]) -> int:
+    springs = [unfold(s, 5) for s in springs]
+    return sum(num_matching_springs(s, groups) for s, groups in springs)
+
+
+def solve(text: str) -> tuple[int, int]:
+    springs = parse(text)
+    return part1(springs), part2(springs)
+
+
+if __name__ == "__main__":
+    load.main(solve, "12.input")
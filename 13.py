@@ -4,6 +4,8 @@ from functools import cached_property
 from itertools import chain, combinations
 from typing import Self
 
+from aoc import load
+
 
 def find_reflections(strings: list[str], start: int = 1) -> Iterator[int]:
     if start == len(strings):
@@ -54,11 +56,24 @@ class Pattern:
         return next(r for r in results if r != without_smudge)
 
 
-with open("13.input") as f:
-    patterns = [Pattern.parse(b.splitlines()) for b in f.read().split("\n\n")]
+def parse(text: str) -> list[Pattern]:
+    return [Pattern.parse(b.splitlines()) for b in text.split("\n\n")]
+
 
 # Part 1: Sum of reflection lines in each pattern?
-print(sum(pattern.find_reflection() for pattern in patterns))
+def part1(patterns: list[Pattern]) -> int:
+    return sum(pattern.find_reflection() for pattern in patterns)
+
 
 # Part 2: Sum of reflection lines in each pattern after finding smudges?
-print(sum(pattern.find_smudged_reflection() for pattern in patterns))
+def part2(patterns: list[Pattern]) -> int:
+    return sum(pattern.find_smudged_reflection() for pattern in patterns)
+
+
+def solve(text: str) -> tuple[int, int]:
+    patterns = parse(text)
+    return part1(patterns), part2(patterns)
+
+
+if __name__ == "__main__":
+    load.main(solve, "13.input")
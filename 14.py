@@ -1,83 +1,90 @@
-from functools import cache
+from aoc import cycles, load
+from aoc.grid import Grid
+from aoc.memo import memo
 
-Platform = tuple[str, ...]
+Platform = Grid  # with a border of cube-shaped rocks
 
 
-@cache
-def tilt_line(line: str) -> str:
-    return "#".join(
-        "".join(["O"] * word.count("O") + ["."] * word.count("."))
-        for word in line.split("#")
+@memo(maxsize=1024)  # plenty for the lines seen while cycling
+def tilt_line(line: bytes) -> bytes:
+    """Roll all round rocks towards the start of the line."""
+    return b"#".join(
+        b"O" * word.count(b"O") + b"." * word.count(b".")
+        for word in line.split(b"#")
     )
 
 
-def tilt_left(platform: Platform) -> Platform:
-    return tuple(tilt_line(line) for line in platform)
+Line = tuple[int, int | None, int]  # start, stop and step of cells slice
 
 
-def rotate_ccw(platform: Platform) -> Platform:
-    line_len = len(platform[0])
-    return tuple(
-        "".join(line[x] for line in platform) for x in reversed(range(line_len))
-    )
+def lines(platform: Platform, dir: int) -> list[Line]:
+    """Return all rows/columns of cells, starting from the side facing dir."""
+    stride, width, height = platform.stride, platform.width, platform.height
+    bottom = len(platform.cells) - stride  # start of the bottom border row
+    if dir == platform.N:
+        return [(x, None, stride) for x in range(1, width + 1)]
+    if dir == platform.S:
+        return [(bottom + x, None, -stride) for x in range(1, width + 1)]
+    if dir == platform.W:
+        return [(y * stride, (y + 1) * stride, 1) for y in range(1, height + 1)]
+    assert dir == platform.E
+    return [
+        ((y + 1) * stride - 1, y * stride - 1, -1) for y in range(1, height + 1)
+    ]
 
 
-def rotate_cw(platform: Platform) -> Platform:
-    line_len = len(platform[0])
-    return tuple(
-        "".join(line[x] for line in reversed(platform)) for x in range(line_len)
-    )
+def tilt(platform: Platform, dir: int) -> None:
+    """Tilt the platform (in-place) so that round rocks roll towards dir."""
+    cells = platform.cells
+    for start, stop, step in lines(platform, dir):
+        cells[start:stop:step] = tilt_line(bytes(cells[start:stop:step]))
+
 
+def total_load_on_N_support_beam(platform: Platform) -> int:  # noqa: N802
+    # Rows are 1-based (after the border), and the bottom row has load 1
+    bottom = platform.height + 1
+    return sum(bottom - pos // platform.stride for pos in platform.find("O"))
 
-def rotate_180(platform: Platform) -> Platform:
-    return tuple("".join(reversed(line)) for line in reversed(platform))
 
+def one_cycle(platform: Platform) -> None:
+    for dir in [platform.N, platform.W, platform.S, platform.E]:
+        tilt(platform, dir)
 
-def tilt_north(platform: Platform) -> Platform:
-    # Turn CCW to have N face left, tilt, and turn back again
-    return rotate_cw(tilt_left(rotate_ccw(platform)))
 
+def run_cycles(platform: Platform, n: int) -> Platform:
+    """Return the platform after n spin cycles, skipping repeated cycles."""
+    platform = platform.copy()
 
-def total_load_on_N_support_beam(platform: Platform) -> int:  # noqa: N802
-    total = 0
-    height = len(platform)
-    for y, line in enumerate(platform):
-        total += line.count("O") * (height - y)
-    return total
-
-
-def one_cycle(platform: Platform) -> Platform:
-    platform = rotate_ccw(platform)  # N -> left
-    platform = tilt_left(platform)
-    platform = rotate_cw(platform)  # W -> left
-    platform = tilt_left(platform)
-    platform = rotate_cw(platform)  # S -> left
-    platform = tilt_left(platform)
-    platform = rotate_cw(platform)  # E -> left
-    platform = tilt_left(platform)
-    return rotate_180(platform)  # W -> left
-
-
-def cycles(platform: Platform, n: int) -> Platform:
-    seen = {platform: n}
-    period = None
-    while n > 0:
-        platform = one_cycle(platform)
-        n -= 1
-        if platform not in seen:  # still searching
-            seen[platform] = n
-        elif period is None:  # found period
-            period = seen[platform] - n
-            n %= period
+    def spin(cells: bytes) -> bytes:
+        platform.cells[:] = cells
+        one_cycle(platform)
+        return bytes(platform.cells)
+
+    start = bytes(platform.cells)
+    platform.cells[:] = cycles.nth(start, spin, n, fingerprint=hash)
     return platform
 
 
-with open("14.input") as f:
-    platform = tuple(line.rstrip() for line in f)  # Lines go N->S, W faces left
-    assert len({len(line) for line in platform}) == 1  # same length lines
+def parse(text: str) -> Platform:
+    return Grid.parse(text, border="#")
+
 
 # Part 1: What is the total load on the north support beams?
-print(total_load_on_N_support_beam(tilt_north(platform)))
+def part1(platform: Platform) -> int:
+    platform = platform.copy()
+    tilt(platform, platform.N)
+    return total_load_on_N_support_beam(platform)
+
 
 # Part 2: What is the total load on the north support beams after 1B cycles?
-print(total_load_on_N_support_beam(cycles(platform, 1_000_000_000)))
+def part2(platform: Platform) -> int:
+    return total_load_on_N_support_beam(run_cycles(platform, 1_000_000_000))
+
+
+def solve(text: str) -> tuple[int, int]:
+    platform = parse(text)
+    return part1(platform), part2(platform)
+
+
+if __name__ == "__main__":
+    load.main(solve, "14.input")
@@ -2,6 +2,8 @@ from collections.abc import Iterator
 from contextlib import suppress
 from functools import reduce
 
+from aoc import load
+
 
 def hash(s: str) -> int:
     return reduce(lambda acc, c: ((acc + ord(c)) * 17) % 256, s, 0)
@@ -32,11 +34,24 @@ def focusing_powers(boxes: list[dict[str, int]]) -> Iterator[int]:
             yield n * slot * flen
 
 
-with open("15.input") as f:
-    init_sequence = f.read().rstrip().split(",")
+def parse(text: str) -> list[str]:
+    return text.rstrip().split(",")
+
 
 # Part 1: What is the sum of the hashes for each initialization step?
-print(sum(hash(s) for s in init_sequence))
+def part1(init_sequence: list[str]) -> int:
+    return sum(hash(s) for s in init_sequence)
+
 
 # Part 2: What is the focusing power of the resulting lens configuration?
-print(sum(focusing_powers(process_init_sequence(init_sequence))))
+def part2(init_sequence: list[str]) -> int:
+    return sum(focusing_powers(process_init_sequence(init_sequence)))
+
+
+def solve(text: str) -> tuple[int, int]:
+    init_sequence = parse(text)
+    return part1(init_sequence), part2(init_sequence)
+
+
+if __name__ == "__main__":
+    load.main(solve, "15.input")
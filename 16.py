@@ -1,94 +1,72 @@
-from collections import deque
-from collections.abc import Iterable
-from functools import cache
+from functools import partial
 from itertools import chain
-from typing import NamedTuple, Self
 
+from aoc import load, search
+from aoc.grid import Grid
+from aoc.memo import memo
 
-class Coord(NamedTuple):
-    y: int
-    x: int
+N, E, S, W = range(4)  # indices into Grid.dirs4
 
-    def __add__(self, other: Self) -> Self:  # type: ignore[override]
-        return self.__class__(self.y + other.y, self.x + other.x)
-
-
-Direction = Coord
-Directions = list[Direction]
-DirMap = dict[Direction, Directions]
-
-UP = Direction(-1, 0)
-DOWN = Direction(1, 0)
-LEFT = Direction(0, -1)
-RIGHT = Direction(0, 1)
-DIR_MAP: dict[str, DirMap] = {
-    ".": {UP: [UP], DOWN: [DOWN], LEFT: [LEFT], RIGHT: [RIGHT]},
-    "/": {UP: [RIGHT], RIGHT: [UP], DOWN: [LEFT], LEFT: [DOWN]},
-    "\\": {UP: [LEFT], LEFT: [UP], DOWN: [RIGHT], RIGHT: [DOWN]},
-    "-": {UP: [LEFT, RIGHT], DOWN: [LEFT, RIGHT], LEFT: [LEFT], RIGHT: [RIGHT]},
-    "|": {UP: [UP], DOWN: [DOWN], LEFT: [UP, DOWN], RIGHT: [UP, DOWN]},
+DIR_MAP: dict[str, dict[int, list[int]]] = {
+    ".": {N: [N], S: [S], W: [W], E: [E]},
+    "/": {N: [E], E: [N], S: [W], W: [S]},
+    "\\": {N: [W], W: [N], S: [E], E: [S]},
+    "-": {N: [W, E], S: [W, E], W: [W], E: [E]},
+    "|": {N: [N], S: [S], W: [N, S], E: [N, S]},
 }
 
+Beam = int  # position * 4 + direction
 
-class Beam(NamedTuple):
-    pos: Coord
-    direction: Direction
 
+def new_beam(pos: int, dir: int) -> Beam:
+    return pos * 4 + dir
 
-class Grid(NamedTuple):
-    chars: list[str]
-    height: int
-    width: int
 
-    @classmethod
-    def parse(cls, lines: Iterable[str]) -> Self:
-        lines = [line.rstrip() for line in lines]
-        height = len(lines)
-        line_lens = {len(line) for line in lines}
-        assert len(line_lens) == 1
-        width = line_lens.pop()
-        assert all(all(c in ".|-/\\" for c in line) for line in lines)
-        return cls(lines, height, width)
+@memo()  # at most one entry per beam, i.e. 4 per cell
+def follow(grid: Grid, beam: Beam) -> list[Beam]:
+    """Return the beams that continue from this one, and stay in the grid."""
+    pos, dir = divmod(beam, 4)
+    return [
+        new_beam(pos + grid.dirs4[d], d)
+        for d in DIR_MAP[grid[pos]][dir]
+        if grid.cells[pos + grid.dirs4[d]] != grid.border
+    ]
 
-    def at(self, pos: Coord) -> str:
-        return self.chars[pos.y][pos.x]
 
-    def contains(self, pos: Coord) -> bool:
-        return (0 <= pos.y < self.height) and (0 <= pos.x < self.width)
+def count_energized(grid: Grid, start: Beam) -> int:
+    beams = search.reachable(
+        [start], partial(follow, grid), len(grid.cells) * 4
+    )
+    return len({beam // 4 for beam in beams})
 
 
-with open("16.input") as f:
-    grid = Grid.parse(f)
+def parse(text: str) -> Grid:
+    grid = Grid.parse(text)
+    assert all(grid[pos] in DIR_MAP for pos in grid.positions())
+    return grid
 
 
-@cache
-def follow(beam: Beam) -> list[Beam]:
-    return [
-        Beam(beam.pos + newdir, newdir)
-        for newdir in DIR_MAP[grid.at(beam.pos)][beam.direction]
-    ]
+# Part 1: How many tiles are energized when starting at (0,0) from the left?
+def part1(grid: Grid) -> int:
+    return count_energized(grid, new_beam(grid.pos(0, 0), E))
 
 
-def count_energized(grid: Grid, start: Beam) -> int:
-    seen: set[Beam] = set()
-    queue = deque([start])
-    while queue:
-        beam = queue.pop()
-        if not grid.contains(beam.pos) or beam in seen:
-            continue
-        seen.add(beam)
-        queue.extend(follow(beam))
-    return len({beam.pos for beam in seen})
+# Part 2: How many tiles are energized when starting at the best edge position?
+def part2(grid: Grid) -> int:
+    h, w = grid.height, grid.width
+    start_alts = chain(
+        (new_beam(grid.pos(y, 0), E) for y in range(h)),
+        (new_beam(grid.pos(y, w - 1), W) for y in range(h)),
+        (new_beam(grid.pos(0, x), S) for x in range(w)),
+        (new_beam(grid.pos(h - 1, x), N) for x in range(w)),
+    )
+    return max(count_energized(grid, start) for start in start_alts)
 
 
-# Part 1: How many tiles are energized when starting at (0,0) from the left?
-print(count_energized(grid, Beam(Coord(0, 0), RIGHT)))
+def solve(text: str) -> tuple[int, int]:
+    grid = parse(text)
+    return part1(grid), part2(grid)
 
-# Part 2: How many tiles are energized when starting at the best edge position?
-start_alts = chain(
-    (Beam(Coord(y, 0), RIGHT) for y in range(grid.height)),
-    (Beam(Coord(y, grid.width - 1), LEFT) for y in range(grid.height)),
-    (Beam(Coord(0, x), DOWN) for x in range(grid.width)),
-    (Beam(Coord(grid.height - 1, x), UP) for x in range(grid.width)),
-)
-print(max(count_energized(grid, start) for start in start_alts))
+
+if __name__ == "__main__":
+    load.main(solve, "16.input")
@@ -5,8 +5,11 @@ from dataclasses import dataclass
 from itertools import batched, takewhile
 from typing import NamedTuple, Self
 
+from aoc import load
+from aoc.intervals import IntervalSet
 
-def parse(line: str) -> tuple[tuple[str, int], tuple[str, int]]:
+
+def parse_line(line: str) -> tuple[tuple[str, int], tuple[str, int]]:
     dir1, amount, color = line.split()
     assert len(dir1) == 1 and dir1 in "UDLR"
     n1 = int(amount)
@@ -50,36 +53,10 @@ class Line:
         return cls(min(start, end), max(start, end), dir in "UD"), end
 
 
-class Span(NamedTuple):
-    start: int
-    end: int  # inclusive
-
-    def union(self, other: Self) -> Iterator[Span]:
-        assert other.start >= self.start
-        if self.end < other.start:  # no overlap
-            yield self
-            yield other
-        elif self.end >= other.start:  # overlap
-            yield Span(self.start, max(self.end, other.end))
-        else:
-            raise RuntimeError
-
-    @classmethod
-    def spans_between_vlines(cls, vlines: Iterable[Line]) -> Iterator[Self]:
-        for x_a, x_b in batched(sorted([line.start.x for line in vlines]), 2):
-            yield cls(x_a, x_b)
-
-    @staticmethod
-    def merge(spans: list[Span]) -> Iterator[Span]:
-        spans = sorted(spans)
-        cur = spans.pop(0)
-        while spans:
-            cur, *nxt = list(cur.union(spans.pop(0)))
-            if nxt:
-                assert len(nxt) == 1
-                yield cur
-                cur = nxt[0]
-        yield cur
+def spans_between_vlines(vlines: Iterable[Line]) -> IntervalSet:
+    """Return the x coordinates covered between pairs of vertical lines."""
+    xs = sorted([line.start.x for line in vlines])
+    return IntervalSet.from_spans((x_a, x_b + 1) for x_a, x_b in batched(xs, 2))
 
 
 def dig_trench(instructions: Iterable[tuple[str, int]]) -> Iterator[Line]:
@@ -104,8 +81,8 @@ def measure_area_inside(vlines: Iterable[Line]) -> int:
         )
         # Add area covered between old_y + 1 and new_y
         assert len(active_lines) % 2 == 0
-        x_spans_before = list(Span.spans_between_vlines(active_lines))
-        width = sum(b + 1 - a for a, b in x_spans_before)
+        x_spans_before = spans_between_vlines(active_lines)
+        width = x_spans_before.size()
         height = new_y - (old_y + 1)
         total_area += height * width
         # Find lines that end here, and lines that start here
@@ -116,20 +93,38 @@ def measure_area_inside(vlines: Iterable[Line]) -> int:
         active_lines.sort(key=lambda line: line.end.y)
         del lines[: len(news)]
         # Add area covered on new_y
-        x_spans_after = list(Span.spans_between_vlines(active_lines))
-        x_spans_merged = list(Span.merge(x_spans_before + x_spans_after))
-        total_area += sum(b + 1 - a for a, b in x_spans_merged)
+        x_spans_after = spans_between_vlines(active_lines)
+        total_area += (x_spans_before | x_spans_after).size()
         # Update y
         old_y = new_y
 
     return total_area
 
 
-with open("18.input") as f:
-    p1_instr, p2_instr = zip(*[parse(line) for line in f], strict=True)
+Instructions = tuple[tuple[str, int], ...]
+
+
+def parse(text: str) -> tuple[Instructions, Instructions]:
+    p1_instr, p2_instr = zip(
+        *[parse_line(line) for line in text.splitlines()], strict=True
+    )
+    return p1_instr, p2_instr
+
 
 # Part 1: How many cubic meters of lava could the lagoon hold?
-print(measure_area_inside(dig_trench(p1_instr)))
+def part1(plans: tuple[Instructions, Instructions]) -> int:
+    return measure_area_inside(dig_trench(plans[0]))
+
 
 # Part 2: How many cubic meters of lava could the bigger lagoon hold?
-print(measure_area_inside(dig_trench(p2_instr)))
+def part2(plans: tuple[Instructions, Instructions]) -> int:
+    return measure_area_inside(dig_trench(plans[1]))
+
+
+def solve(text: str) -> tuple[int, int]:
+    plans = parse(text)
+    return part1(plans), part2(plans)
+
+
+if __name__ == "__main__":
+    load.main(solve, "18.input")
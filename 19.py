@@ -5,6 +5,9 @@ from math import prod
 from operator import gt, lt
 from typing import Self, cast
 
+from aoc import load
+from aoc.intervals import IntervalSet
+
 
 @dataclass(frozen=True)
 class Part:
@@ -75,38 +78,22 @@ def accepted(workflows: dict[str, Workflow], part: Part, start: str) -> bool:
     return cur == "A"
 
 
-@dataclass(frozen=True)
-class Span:
-    start: int
-    end: int  # exclusive
-
-    def length(self) -> int:
-        return self.end - self.start
-
-    def split(self, val: int) -> tuple[Self | None, Self | None]:
-        if val <= self.start:
-            return None, self
-        if val >= self.end:
-            return self, None
-        return self.__class__(self.start, val), self.__class__(val, self.end)
-
-
 @dataclass
 class QPart:
     """A "quantum" Part, keeping track of _ranges_ of member values."""
 
-    x: Span
-    m: Span
-    a: Span
-    s: Span
+    x: IntervalSet
+    m: IntervalSet
+    a: IntervalSet
+    s: IntervalSet
 
     @classmethod
     def new(cls) -> Self:
-        return cls(*[Span(1, 4001) for _ in range(4)])
+        return cls(*[IntervalSet([1, 4001]) for _ in range(4)])
 
     def distinct(self) -> int:
         return cast(
-            int, prod(getattr(self, member).length() for member in "xmas")
+            int, prod(getattr(self, member).size() for member in "xmas")
         )
 
     def process(
@@ -129,20 +116,44 @@ class QPart:
             else:
                 assert rule.op is lt
                 true_span, false_span = span.split(rule.val)
-            true_qpart = replace(self, **{rule.var: true_span})
-            yield from true_qpart.process(workflows, rule.dst)
+            if true_span:
+                true_qpart = replace(self, **{rule.var: true_span})
+                yield from true_qpart.process(workflows, rule.dst)
+            if not false_span:
+                break
             setattr(self, rule.var, false_span)
 
 
-with open("19.input") as f:
-    par1, par2 = f.read().split("\n\n")
+System = tuple[dict[str, Workflow], list[Part]]
+
+
+def parse(text: str) -> System:
+    par1, par2 = text.split("\n\n")
     workflow_list = [Workflow.parse(line) for line in par1.splitlines()]
     workflows = {wf.name: wf for wf in workflow_list}
     parts = [Part.parse(line) for line in par2.splitlines()]
+    return workflows, parts
+
 
 # Part 1: What is the sum of rating numbers for all parts that get accepted?
-print(sum(part.rating() for part in parts if accepted(workflows, part, "in")))
+def part1(system: System) -> int:
+    workflows, parts = system
+    return sum(
+        part.rating() for part in parts if accepted(workflows, part, "in")
+    )
+
 
 # Part 2: How many distinct combinations of ratings will be accepted?
-qparts = list(QPart.new().process(workflows, "in"))
-print(sum(qpart.distinct() for qpart in qparts))
+def part2(system: System) -> int:
+    workflows, _ = system
+    qparts = list(QPart.new().process(workflows, "in"))
+    return sum(qpart.distinct() for qpart in qparts)
+
+
+def solve(text: str) -> tuple[int, int]:
+    system = parse(text)
+    return part1(system), part2(system)
+
+
+if __name__ == "__main__":
+    load.main(solve, "19.input")
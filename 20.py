@@ -1,9 +1,12 @@
 from collections import deque
 from collections.abc import Iterable, Iterator
+from copy import deepcopy
 from dataclasses import dataclass, field
 from math import prod
 from typing import Self
 
+from aoc import counters, load
+
 DEBUG = False
 
 
@@ -14,7 +17,7 @@ class Pulse:
     state: bool
 
     def __str__(self) -> str:
-        return f"{self.src} -{"high" if self.state else "low"}-> {self.dst}"
+        return f"{self.src} -{'high' if self.state else 'low'}-> {self.dst}"
 
 
 @dataclass
@@ -109,6 +112,7 @@ class Circuit:
         return cls(modules)
 
     def _process_pulses(self, pulse: Pulse) -> None:
+        before = self.high_pulses + self.low_pulses
         pulses = deque([pulse])
         while pulses:
             pulse = pulses.popleft()
@@ -119,6 +123,7 @@ class Circuit:
                 self.low_pulses += 1
                 if pulse.src in self.probes:
                     self.probes[pulse.src] += 1
+        counters.add("pulses", self.high_pulses + self.low_pulses - before)
 
     def push_button(self) -> None:
         self._process_pulses(Pulse("button", "broadcaster", state=False))
@@ -135,14 +140,17 @@ class Circuit:
         del self.probes[probe]
 
 
-with open("20.input") as f:
-    lines = f.readlines()
+def parse(text: str) -> Circuit:
+    return Circuit.parse(text.splitlines())
+
 
 # Part 1: What do you get if you multiply #LOW pulses and #HIGH pulses?
-circuit = Circuit.parse(lines)
-for _ in range(1000):
-    circuit.push_button()
-print(circuit.high_pulses * circuit.low_pulses)
+def part1(circuit: Circuit) -> int:
+    circuit = deepcopy(circuit)
+    for _ in range(1000):
+        circuit.push_button()
+    return circuit.high_pulses * circuit.low_pulses
+
 
 # Part 2: What is the fewest number of button presses single LOW  pulse to "rx"?
 #
@@ -167,23 +175,33 @@ print(circuit.high_pulses * circuit.low_pulses)
 # We solve this by analyzing each of the 4 networks separately to determine
 # these 4 12-bit counter values, and the end result is the product of these
 # counters.
-circuit = Circuit.parse(lines)
-
-# Identify the 4 networks by following the connections from the "broadcaster"
-# until we find a Conjunction node.
-for module in circuit.modules["broadcaster"].outputs:
-    circuit.set_probe(circuit.find_next_conjunction(module))
-
-# Keep pushing button until each network has emitted one LOW pulse each
-periods = []
-n = 0
-while circuit.probes:
-    circuit.push_button()
-    n += 1
-    triggered = {name for name, count in circuit.probes.items() if count > 0}
-    for name in triggered:
-        periods.append(n)
-        circuit.remove_probe(name)
-
-# Multiply periods together to get overall answer
-print(prod(periods))
+def part2(circuit: Circuit) -> int:
+    circuit = deepcopy(circuit)
+
+    # Identify the 4 networks by following the connections from the
+    # "broadcaster" until we find a Conjunction node.
+    for module in circuit.modules["broadcaster"].outputs:
+        circuit.set_probe(circuit.find_next_conjunction(module))
+
+    # Keep pushing button until each network has emitted one LOW pulse each
+    periods = []
+    n = 0
+    while circuit.probes:
+        circuit.push_button()
+        n += 1
+        triggered = {name for name, count in circuit.probes.items() if count}
+        for name in triggered:
+            periods.append(n)
+            circuit.remove_probe(name)
+
+    # Multiply periods together to get overall answer
+    return prod(periods)
+
+
+def solve(text: str) -> tuple[int, int]:
+    circuit = parse(text)
+    return part1(circuit), part2(circuit)
+
+
+if __name__ == "__main__":
+    load.main(solve, "20.input")
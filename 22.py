@@ -1,22 +1,18 @@
-from collections import deque
-from collections.abc import Iterator
+from collections.abc import Buffer, Iterator
 from dataclasses import dataclass, replace
 from itertools import cycle
 from math import prod
 from string import ascii_letters
 from typing import NamedTuple, Self
 
+from aoc import bitset, load
+
 
 class Coord(NamedTuple):
     z: int
     y: int
     x: int
 
-    @classmethod
-    def parse(cls, s: str) -> Self:
-        x, y, z = (int(n) for n in s.split(","))
-        return cls(z, y, x)
-
     def __add__(self, other: Self) -> Self:  # type: ignore[override]
         cls = self.__class__
         return cls(self.z + other.z, self.y + other.y, self.x + other.x)
@@ -46,9 +42,10 @@ class Brick:
     name: str
 
     @classmethod
-    def parse(cls, line: str, name: str) -> Self:
-        start, end = line.rstrip().split("~")
-        return cls(Coord.parse(start), Coord.parse(end), name)
+    def parse(cls, line: Buffer, name: str) -> Self:
+        """Parse b"x,y,z~x,y,z" into a brick with the given name."""
+        x1, y1, z1, x2, y2, z2 = load.ints(line)
+        return cls(Coord(z1, y1, x1), Coord(z2, y2, x2), name)
 
     def __post_init__(self) -> None:
         assert self.start <= self.end  # sorted
@@ -114,43 +111,26 @@ def support_pairs(bricks: list[Brick]) -> Iterator[tuple[Brick, Brick]]:
             yield under, brick
 
 
-def find_supporters(bricks: list[Brick]) -> dict[Brick, set[Brick]]:
-    """Map supportee -> set of supporters."""
-    ret: dict[Brick, set[Brick]] = {}  # C -> {B, A}: C is supported by B and A
+def find_supporters(bricks: list[Brick]) -> list[bitset.Bits]:
+    """Map supportee -> set of supporters, by their index in bricks."""
+    index = bitset.Index(bricks)
+    ret = [bitset.EMPTY] * len(bricks)  # C -> {B, A}: C is supported by B, A
     for under, over in support_pairs(bricks):
-        ret.setdefault(over, set()).add(under)
-    return ret
-
-
-def find_supportees(bricks: list[Brick]) -> dict[Brick, set[Brick]]:
-    """Map supporter -> set of supportees."""
-    ret: dict[Brick, set[Brick]] = {}  # A -> {B, C}: A supports B and C
-    for under, over in support_pairs(bricks):
-        ret.setdefault(under, set()).add(over)
+        ret[index.numbers[over]] |= index.bits[under]
     return ret
 
 
 def can_be_disintegrated(bricks: list[Brick]) -> Iterator[Brick]:
     """Yield the bricks that can be removed without causing others to fall."""
-    supporters = find_supporters(bricks)
-    supportees = find_supportees(bricks)
+    index = bitset.Index(bricks)
+    sole_supporters = {
+        supporters
+        for supporters in find_supporters(bricks)
+        if bitset.count(supporters) == 1
+    }
     for brick in bricks:
-        if brick not in supportees:  # brick is not supporting any other bricks
-            yield brick
-            continue
-        if not any(len(supporters[child]) == 1 for child in supportees[brick]):
+        if index.bits[brick] not in sole_supporters:
             yield brick
-            continue
-
-
-def traverse(
-    supportees: dict[Brick, set[Brick]], grounded: list[Brick]
-) -> Iterator[Brick]:
-    queue = deque(grounded)
-    while queue:
-        current = queue.popleft()
-        yield current
-        queue.extend(supportees.get(current, []))
 
 
 def fallout(bricks: list[Brick]) -> Iterator[tuple[Brick, int]]:
@@ -159,32 +139,45 @@ def fallout(bricks: list[Brick]) -> Iterator[tuple[Brick, int]]:
     Yield (brick, fallout) pairs associating a brick with the number of other
     bricks that would fall if that first brick is removed.
     """
-    # Using a dict mapping supporters to supportees, we can traverse this dict
-    # starting from the supporters on the ground to find all supported bricks.
-    # To find how many bricks would fall when removing one brick (X), we remove
-    # brick X from this dict, and re-traverse to see how many bricks remain
-    # supported. The number of bricks that will fall is found by subtracting
-    # this number from the total number of bricks.
-    num_bricks = len(bricks)
-    supportees = find_supportees(bricks)
-    grounded = [brick for brick in bricks if brick.on_ground()]
-    assert len(set(traverse(supportees, grounded))) == num_bricks
-
-    for supporter in supportees:
-        without_supporter = supportees.copy()
-        del without_supporter[supporter]
-        remain_supported = len(set(traverse(without_supporter, grounded)))
-        yield supporter, num_bricks - remain_supported
-
-
-with open("22.input") as f:
+    # The settled bricks are sorted bottom-up, so every brick comes after all
+    # of its supporters. To find how many bricks would fall when removing one
+    # brick (X), we start with a set of fallen bricks containing only X, and
+    # go through the bricks after X in order: a brick falls when it is not on
+    # the ground, and all of its supporters are in the set of fallen bricks.
+    supporters = find_supporters(bricks)
+    for i, brick in enumerate(bricks):
+        fallen = bitset.bit(i)
+        for j in range(i + 1, len(bricks)):
+            below = supporters[j]
+            if below and not below & ~fallen:
+                fallen |= bitset.bit(j)
+        yield brick, bitset.count(fallen) - 1
+
+
+def parse(text: load.Input) -> list[Brick]:
+    """Parse bricks from the snapshot, and let them settle."""
+    lines = load.lines(load.as_bytes(text))
     bricks = [
-        Brick.parse(line, name) for line, name in zip(f, cycle(ascii_letters))
+        Brick.parse(line, name)
+        for line, name in zip(lines, cycle(ascii_letters))
     ]
-settled = settle(bricks)
+    return settle(bricks)
+
+
+# Part 1: How many bricks could be safely chosen as the one to disintegrate?
+def part1(settled: list[Brick]) -> int:
+    return len(list(can_be_disintegrated(settled)))
 
-# # Part 1: How many bricks could be safely chosen as the one to disintegrate?
-print(len(list(can_be_disintegrated(settled))))
 
 # Part 2: What is the sum of the number of other bricks that would fall?
-print(sum(num_falling for _, num_falling in fallout(settled)))
+def part2(settled: list[Brick]) -> int:
+    return sum(num_falling for _, num_falling in fallout(settled))
+
+
+def solve(text: load.Input) -> tuple[int, int]:
+    settled = parse(text)
+    return part1(settled), part2(settled)
+
+
+if __name__ == "__main__":
+    load.main_raw(solve, "22.input")
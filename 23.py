@@ -1,184 +1,130 @@
 from collections import deque
-from collections.abc import Iterable, Iterator
-from dataclasses import dataclass
-from functools import cached_property
+from collections.abc import Iterator
 from typing import NamedTuple, Self
 
-from bitsets import bitset  # type: ignore
+from aoc import bitset, counters, load, search
+from aoc.grid import Grid
 
+Cost = int
+Graph = dict[int, dict[int, Cost]]
 
-class Coord(NamedTuple):
-    y: int
-    x: int
-
-    def __add__(self, other: Self) -> Self:  # type: ignore[override]
-        return self.__class__(self.y + other.y, self.x + other.x)
 
-    def nbors(self) -> Iterator[Self]:
-        cls = self.__class__
-        yield cls(self.y - 1, self.x)  # N
-        yield cls(self.y, self.x + 1)  # E
-        yield cls(self.y + 1, self.x)  # S
-        yield cls(self.y, self.x - 1)  # W
+SLOPES = "^>v<"  # in the same order as Grid.dirs4
 
 
-Cost = int
-Direction = Coord
-Graph = dict[Coord, dict[Coord, Cost]]
-
-NONE = Direction(0, 0)
-UP = Direction(-1, 0)
-DOWN = Direction(1, 0)
-LEFT = Direction(0, -1)
-RIGHT = Direction(0, 1)
-TURNS = {
-    NONE: [UP, DOWN, LEFT, RIGHT],
-    UP: [LEFT, RIGHT],
-    DOWN: [LEFT, RIGHT],
-    LEFT: [UP, DOWN],
-    RIGHT: [UP, DOWN],
-}
-
-
-@dataclass
-class Grid:
-    rows: list[str]
-    steep_slopes: bool = True
-
-    @classmethod
-    def parse(cls, lines: Iterable[str]) -> Self:
-        return cls([line.rstrip() for line in lines])
-
-    @cached_property
-    def height(self) -> int:
-        return len(self.rows)
-
-    @cached_property
-    def width(self) -> int:
-        line_lens = {len(row) for row in self.rows}
-        assert len(line_lens) == 1
-        return line_lens.pop()
-
-    def __getitem__(self, pos: Coord) -> str:
-        return self.rows[pos.y][pos.x]
-
-    def __contains__(self, pos: Coord) -> bool:
-        return 0 <= pos.y < self.height and 0 <= pos.x < self.width
-
-    def start(self) -> Coord:
-        ret = Coord(0, 1)
-        assert self[ret] == "."
-        return ret
-
-    def end(self) -> Coord:
-        ret = Coord(self.height - 1, self.width - 2)
-        assert self[ret] == "."
-        return ret
-
-    def render(self, extra: dict[Coord, str] | None = None) -> str:
-        if extra is None:
-            extra = {}
-        lines = []
-        for y in range(self.height):
-            line = []
-            for x in range(self.width):
-                pos = Coord(y, x)
-                line.append(extra.get(pos, self[pos]))
-            lines.append("".join(line))
-        return "\n".join(lines)
-
-    def nbors(self, pos: Coord) -> Iterator[Coord]:
-        for dir, slope in [(UP, "^"), (DOWN, "v"), (LEFT, "<"), (RIGHT, ">")]:
-            nbor = pos + dir
-            if self.steep_slopes:
-                if nbor in self and self[nbor] in {".", slope}:
-                    yield nbor
-            elif nbor in self and self[nbor] != "#":
+def nbors(grid: Grid, pos: int, *, steep_slopes: bool) -> Iterator[int]:
+    if steep_slopes and (forced := SLOPES.find(grid[pos])) >= 0:
+        yield pos + grid.dirs4[forced]  # must follow the slope
+        return
+    for dir, slope in zip(grid.dirs4, SLOPES, strict=True):
+        nbor = pos + dir
+        if steep_slopes:
+            if grid[nbor] in {".", slope}:
                 yield nbor
+        elif grid[nbor] != "#":
+            yield nbor
+
+
+def crossroads(grid: Grid) -> Iterator[int]:
+    """Generate the positions where three or more paths meet."""
+    for pos in grid.positions():
+        if grid[pos] != "#":
+            paths = sum(grid[pos + d] != "#" for d in grid.dirs4)
+            if paths > 2:
+                yield pos
+
+
+def corridors(grid: Grid, nodes: set[int], *, steep_slopes: bool) -> Graph:
+    """Find the length of the corridors between each pair of nodes."""
+
+    def walk(start: int) -> dict[int, Cost]:
+        def steps(pos: int) -> Iterator[int]:
+            if pos == start or pos not in nodes:  # stop at other nodes
+                yield from nbors(grid, pos, steep_slopes=steep_slopes)
+
+        dist = search.bfs([start], steps, len(grid.cells)).dist
+        return {
+            node: dist[node]
+            for node in nodes
+            if node != start and dist[node] != search.UNREACHED
+        }
+
+    return {node: walk(node) for node in nodes}
 
-    def adjacencies(self) -> Graph:
-        ret: Graph = {}
-        dirs = {"^": UP, "v": DOWN, "<": LEFT, ">": RIGHT}
-        for y in range(self.height):
-            for x in range(self.width):
-                pos = Coord(y, x)
-                c = self[pos]
-                if c == "#":
-                    continue
-                nbors = ret.setdefault(pos, {})
-                if c == "." or not self.steep_slopes:
-                    nbors.update(dict.fromkeys(self.nbors(pos), 1))
-                elif c in dirs:
-                    nbor = pos + dirs[c]
-                    assert self[nbor] != "#"
-                    nbors[nbor] = 1
-                else:
-                    raise RuntimeError
-        return ret
-
-
-def optimize(graph: Graph) -> Graph:
-    """Remove all non-crossroads from the graph."""
-    for pos in list(graph):
-        nbors = graph[pos]
-        if len(nbors) != 2:
-            continue
-        (apos, acost), (bpos, bcost) = nbors.items()
-        if pos in graph[apos]:  # replace graph[apos][pos] -> graph[apos][bpos]
-            graph[apos][bpos] = graph[apos][pos] + bcost
-            del graph[apos][pos]
-        if pos in graph[bpos]:  # replace graph[bpos][pos] -> graph[bpos][apos]
-            graph[bpos][apos] = graph[bpos][pos] + acost
-            del graph[bpos][pos]
-        if not any(pos in graph.get(nbor, []) for nbor in pos.nbors()):
-            del graph[pos]
-    return graph
-
-
-def longest_paths(graph: Graph, start: Coord, end: Coord) -> Cost:
+
+def longest_paths(graph: Graph, start: int, end: int) -> Cost:
     assert start in graph
     assert end in graph
-    node_set = bitset("Nodes", tuple(graph.keys()))
+    nodes = bitset.Index(graph)
+    edges = {
+        node: [(nbor, nodes.bits[nbor], cost) for nbor, cost in nbors.items()]
+        for node, nbors in graph.items()
+    }
 
     class Path(NamedTuple):
-        last: Coord
+        last: int
         cost: Cost
-        seen: bitset  # type: ignore
+        seen: bitset.Bits
 
         @classmethod
-        def new(cls, start: Coord) -> Self:  # type: ignore
-            return cls(start, 0, node_set([start]))
+        def new(cls, start: int) -> Self:
+            return cls(start, 0, nodes.bits[start])
 
-        def followers(self) -> Iterator[Self]:  # type: ignore
-            for nbor, dcost in graph[self.last].items():
-                if nbor not in self.seen:
+        def followers(self) -> Iterator[Self]:
+            for nbor, nbit, dcost in edges[self.last]:
+                if not self.seen & nbit:
                     yield self.__class__(
                         last=nbor,
                         cost=self.cost + dcost,
-                        seen=self.seen.union(node_set([nbor])),
+                        seen=self.seen | nbit,
                     )
 
     queue = deque([Path.new(start)])
     longest = -1
+    expanded = 0
     while queue:
         path = queue.pop()
+        expanded += 1
         if path.last == end:
             if path.cost > longest:
                 longest = path.cost
         else:
             queue.extend(path.followers())
+    counters.add("paths expanded", expanded)
     assert longest >= 0
     return longest
 
 
-with open("23.input") as f:
-    grid = Grid.parse(f)
+Trails = tuple[int, int, Graph, Graph]  # start, end, w/ and w/o slopes
+
+
+def parse(text: str) -> Trails:
+    """Parse the map, and reduce it to graphs of crossroads."""
+    grid = Grid.parse(text, border="#")
+    start, end = grid.pos(0, 1), grid.pos(grid.height - 1, grid.width - 2)
+    assert grid[start] == grid[end] == "."
+    nodes = {start, end, *crossroads(grid)}
+    sloped = corridors(grid, nodes, steep_slopes=True)
+    flat = corridors(grid, nodes, steep_slopes=False)
+    return start, end, sloped, flat
+
 
 # Part 1: How many steps long is the longest hike?
-graph = optimize(grid.adjacencies())
-print(longest_paths(graph, grid.start(), grid.end()))
+def part1(trails: Trails) -> int:
+    start, end, sloped, _ = trails
+    return longest_paths(sloped, start, end)
+
 
 # Part 2: How many steps long is the longest hike after removing slopes?
-grid.steep_slopes = False
-graph = optimize(grid.adjacencies())
-print(longest_paths(graph, grid.start(), grid.end()))
+def part2(trails: Trails) -> int:
+    start, end, _, flat = trails
+    return longest_paths(flat, start, end)
+
+
+def solve(text: str) -> tuple[int, int]:
+    trails = parse(text)
+    return part1(trails), part2(trails)
+
+
+if __name__ == "__main__":
+    load.main(solve, "23.input")
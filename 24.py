@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Iterator
+from collections.abc import Buffer, Iterable, Iterator
 from dataclasses import dataclass
 from fractions import Fraction as Frac
 from functools import cached_property
@@ -7,6 +7,8 @@ from typing import NamedTuple, Self
 
 from sympy import Symbol, solve_poly_system
 
+from aoc import load
+
 
 class Coord(NamedTuple):
     """Point in 3D space."""
@@ -15,10 +17,6 @@ class Coord(NamedTuple):
     y: Frac
     z: Frac
 
-    @classmethod
-    def parse(cls, s: str) -> Self:
-        return cls(*[Frac(word.strip()) for word in s.split(",")])
-
     def __add__(self, o: Self) -> Self:  # type: ignore[override]
         return self.__class__(self.x + o.x, self.y + o.y, self.z + o.z)
 
@@ -72,9 +70,10 @@ class Line3D:
     vel: Coord  # (a, b, c)
 
     @classmethod
-    def parse(cls, line: str) -> Self:
-        pos, vel = line.split("@")
-        return cls(Coord.parse(pos), Coord.parse(vel))
+    def parse(cls, line: Buffer) -> Self:
+        """Parse b"x, y, z @ a, b, c"."""
+        x, y, z, a, b, c = (Frac(n) for n in load.ints(line))
+        return cls(Coord(x, y, z), Coord(a, b, c))
 
     @cached_property
     def xy_formula(self) -> Line2DFormula:
@@ -135,52 +134,71 @@ def intersections(
             yield h1, h2, Coord(x, y, z)
 
 
-with open("24.input") as f:
-    hailstones = [Line3D.parse(line) for line in f]
+def parse(text: load.Input) -> list[Line3D]:
+    return [Line3D.parse(line) for line in load.lines(load.as_bytes(text))]
+
 
 # Part 1: How many of these intersections occur within the test area?
-lower, upper = 200_000_000_000_000, 400_000_000_000_000  # Example: 7, 27
-test_area = (
-    Coord(Frac(lower), Frac(lower), Frac(0)),
-    Coord(Frac(upper), Frac(upper), Frac(0)),
-)
-crossings = [
-    cross
-    for h1, h2, cross in intersections(h.project(z=Frac(0)) for h in hailstones)
-    if cross.within(*test_area) and h1.time(cross) >= 0 and h2.time(cross) >= 0
-]
-print(len(crossings))
+def part1(hailstones: list[Line3D]) -> int:
+    lower, upper = 200_000_000_000_000, 400_000_000_000_000  # Example: 7, 27
+    test_area = (
+        Coord(Frac(lower), Frac(lower), Frac(0)),
+        Coord(Frac(upper), Frac(upper), Frac(0)),
+    )
+    crossings = [
+        cross
+        for h1, h2, cross in intersections(
+            h.project(z=Frac(0)) for h in hailstones
+        )
+        if cross.within(*test_area)
+        and h1.time(cross) >= 0
+        and h2.time(cross) >= 0
+    ]
+    return len(crossings)
+
 
 # Part 2: What is the sum(X, Y, Z) of the initial position of your throw?
-# Set up a system of equations to solve for the position + velocity of our throw
-syms = list(map(Symbol, "x y z vx vy vz".split()))
-X, Y, Z, VX, VY, VZ = syms
-eqs = []
-for i, line in enumerate(hailstones[:3]):  # only look at the first 3 lines
-    # A different time variable for each intersection
-    T = Symbol(f"t{i}")  # type: ignore
-
-    # (x + vx * t) is the x-coordinate of our throw,
-    # (line.pos.x + line.vel.x * t) is the x-coordinate of the hailstone,
-    # set these equal, and subtract to get:
-    #   x + vx * t - line.pos.x + line.vel.x * t = 0
-    # similarly for y and z
-    eqs += [X + VX * T - line.pos.x - line.vel.x * T]
-    eqs += [Y + VY * T - line.pos.y - line.vel.y * T]
-    eqs += [Z + VZ * T - line.pos.z - line.vel.z * T]
-    syms.append(T)
-
-results = solve_poly_system(eqs, *syms)  # type: ignore
-assert len(results) == 1
-x, y, z, vx, vy, vz, *ts = next(iter(results))
-throw = Line3D(Coord(x, y, z), Coord(vx, vy, vz))
-print(sum([throw.pos.x, throw.pos.y, throw.pos.z]))
-
-# Sanity checks
-for hs, t in zip_longest(hailstones, ts):
-    h1, h2, cross = next(iter(intersections([throw, hs])))
-    assert h1 == throw
-    assert h2 == hs
-    assert throw.time(cross) == hs.time(cross)
-    if t is not None:
-        assert throw.time(cross) == t
+def part2(hailstones: list[Line3D]) -> int:
+    # Set up a system of equations to solve for the position + velocity of our
+    # throw
+    syms = list(map(Symbol, "x y z vx vy vz".split()))
+    X, Y, Z, VX, VY, VZ = syms  # noqa: N806
+    eqs = []
+    for i, line in enumerate(hailstones[:3]):  # only look at the first 3 lines
+        # A different time variable for each intersection
+        T = Symbol(f"t{i}")  # type: ignore  # noqa: N806
+
+        # (x + vx * t) is the x-coordinate of our throw,
+        # (line.pos.x + line.vel.x * t) is the x-coordinate of the hailstone,
+        # set these equal, and subtract to get:
+        #   x + vx * t - line.pos.x + line.vel.x * t = 0
+        # similarly for y and z
+        eqs += [X + VX * T - line.pos.x - line.vel.x * T]
+        eqs += [Y + VY * T - line.pos.y - line.vel.y * T]
+        eqs += [Z + VZ * T - line.pos.z - line.vel.z * T]
+        syms.append(T)
+
+    results = solve_poly_system(eqs, *syms)  # type: ignore
+    assert len(results) == 1
+    x, y, z, vx, vy, vz, *ts = next(iter(results))
+    throw = Line3D(Coord(x, y, z), Coord(vx, vy, vz))
+
+    # Sanity checks
+    for hs, t in zip_longest(hailstones, ts):
+        h1, h2, cross = next(iter(intersections([throw, hs])))
+        assert h1 == throw
+        assert h2 == hs
+        assert throw.time(cross) == hs.time(cross)
+        if t is not None:
+            assert throw.time(cross) == t
+
+    return int(sum([throw.pos.x, throw.pos.y, throw.pos.z]))
+
+
+def solve(text: load.Input) -> tuple[int, int]:
+    hailstones = parse(text)
+    return part1(hailstones), part2(hailstones)
+
+
+if __name__ == "__main__":
+    load.main_raw(solve, "24.input")
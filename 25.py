@@ -1,19 +1,21 @@
-import random
 from itertools import chain
+from random import Random
+
+from aoc import load
 
 Node = str
 Edge = tuple[Node, Node]
 Graph = tuple[set[Node], list[Edge]]
 
 
-def contract(graph: Graph, t: int = 2) -> Graph:
+def contract(graph: Graph, rng: Random, t: int = 2) -> Graph:
     # Karger's algorithm
     nodes, edges = graph
     nodes = set(nodes)
     edges = list(edges)
     while len(nodes) > t:
         # Choose a random edge, and remove it
-        e = edges.pop(random.randrange(len(edges) // 2))
+        e = edges.pop(rng.randrange(len(edges) // 2))
         # Collapse nodes into a single, composite node
         a, b = e
         ab = f"{a}/{b}"
@@ -30,18 +32,30 @@ def contract(graph: Graph, t: int = 2) -> Graph:
     return nodes, edges
 
 
-with open("25.input") as f:
-    conns: dict[Node, set[Node]] = {}
-    for line in f:
+def parse(text: str) -> Graph:
+    conns: dict[Node, list[Node]] = {}  # in input order, not hash order
+    for line in text.splitlines():
         first, seconds = line.split(":")
-        conns[first] = set(seconds.split())
+        conns[first] = seconds.split()
+
+    edges: list[Edge] = [(a, b) for a, bs in conns.items() for b in bs]
+    nodes: set[Node] = set(chain.from_iterable(edges))
+    return nodes, edges
 
-edges: list[Edge] = [(a, b) for a, bs in conns.items() for b in bs]
-nodes: set[Node] = set(chain.from_iterable(edges))
 
 # Part 1: What is the product of sizes of these two groups separated by 3 wires?
-min_cut: list[Edge] = []
-while len(min_cut) != 3:
-    _, min_cut = contract((nodes, edges))
-a, b = min_cut[0]
-print(len(a.split("/")) * len(b.split("/")))
+def part1(graph: Graph) -> int:
+    rng = Random(0)  # seeded, so that runs (and benchmarks) are repeatable
+    min_cut: list[Edge] = []
+    while len(min_cut) != 3:
+        _, min_cut = contract(graph, rng)
+    a, b = min_cut[0]
+    return len(a.split("/")) * len(b.split("/"))
+
+
+def solve(text: str) -> tuple[int]:
+    return (part1(parse(text)),)
+
+
+if __name__ == "__main__":
+    load.main(solve, "25.input")
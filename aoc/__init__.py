@@ -0,0 +1 @@
+"""Shared helpers for my Advent of Code 2023 solutions."""
@@ -0,0 +1,34 @@
+"""Sets of small non-negative ints, stored as the bits of a single int.
+
+Bit i of a Bits value is set iff i is in the set. Adding, testing, union and
+intersection are single int operations (|, &), and counting the members is
+int.bit_count(). Since ints are immutable and hashable, a set can be shared
+between search states, or used as a dict key, at no extra cost.
+
+Use an Index to number the items of a fixed universe (nodes in a graph,
+bricks, ...), and to find the bit of each item.
+"""
+
+from collections.abc import Hashable, Iterable
+
+Bits = int
+
+EMPTY: Bits = 0
+
+
+def bit(i: int) -> Bits:
+    return 1 << i
+
+
+def count(bits: Bits) -> int:
+    return bits.bit_count()
+
+
+class Index[T: Hashable]:
+    """Number the items of a fixed universe, to put them in bitsets."""
+
+    def __init__(self, items: Iterable[T]) -> None:
+        items = list(items)
+        self.numbers = {item: i for i, item in enumerate(items)}
+        self.bits = {item: 1 << i for item, i in self.numbers.items()}
+        assert len(self.numbers) == len(items)  # no duplicates
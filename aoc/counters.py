@@ -0,0 +1,30 @@
+"""Named counters of algorithmic work (states visited, pulses sent, ...).
+
+Counting is off by default, and add() then returns right away. Hot loops
+should count in a local variable, and add() the total once at the end, so
+that the cost of counting is near zero whether enabled or not.
+'test.py --counters' enables counting, and prints the counters per day.
+"""
+
+from collections import Counter
+
+_counts: Counter[str] = Counter()
+_enabled = False
+
+
+def enable(*, on: bool = True) -> None:
+    global _enabled  # noqa: PLW0603
+    _enabled = on
+
+
+def add(name: str, n: int = 1) -> None:
+    if _enabled:
+        _counts[name] += n
+
+
+def reset() -> None:
+    _counts.clear()
+
+
+def snapshot() -> dict[str, int]:
+    return dict(sorted(_counts.items()))
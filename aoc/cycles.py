@@ -0,0 +1,117 @@
+"""Find cycles in sequences of states, and skip ahead through them.
+
+Starting from a state x(0), and repeatedly applying a step function, gives the
+states x(1) = step(x(0)), x(2) = step(x(1)), and so on. With a finite number of
+possible states, this sequence must eventually repeat itself: a tail of mu
+states leads into a cycle of length states, i.e. x(i + length) == x(i) for all
+i >= mu.
+
+find() uses Brent's algorithm, which calls step O(mu + length) times, while
+only holding two states at a time, instead of a dict of all states seen so far.
+Given a fingerprint function (e.g. hash), find() instead remembers the compact
+fingerprint of every state, which costs fewer steps, but memory proportional
+to mu + length. The repeated state is then verified in full, and should two
+different states share a fingerprint, find() falls back to Brent's algorithm.
+The number of steps taken is added to aoc.counters.
+"""
+
+from collections.abc import Callable, Hashable, Iterator
+from typing import NamedTuple
+
+from aoc import counters
+
+
+class Cycle[S](NamedTuple):
+    mu: int  # index of the first state in the cycle
+    length: int
+    entry: S  # x(mu), the first state in the cycle
+
+
+def iterate[S](state: S, step: Callable[[S], S]) -> Iterator[S]:
+    """Generate x(0) = state, x(1), x(2), ..."""
+    while True:
+        yield state
+        state = step(state)
+
+
+def advance[S](state: S, step: Callable[[S], S], n: int) -> S:
+    """Return x(n), starting from x(0) = state."""
+    for _ in range(n):
+        state = step(state)
+    counters.add("cycles: steps", n)
+    return state
+
+
+def find[S](
+    start: S,
+    step: Callable[[S], S],
+    *,
+    fingerprint: Callable[[S], Hashable] | None = None,
+) -> Cycle[S]:
+    """Find the cycle in the sequence of states that begins with start."""
+    if fingerprint is not None:
+        cycle = _find_fingerprinted(start, step, fingerprint)
+        if cycle is not None:
+            return cycle
+    return _find_brent(start, step)
+
+
+def _find_brent[S](start: S, step: Callable[[S], S]) -> Cycle[S]:
+    # Find the cycle length: the hare steps ahead one state at a time, and
+    # the tortoise teleports to the hare at every power of two steps, until
+    # the hare steps onto the tortoise.
+    power = length = steps = 1
+    tortoise, hare = start, step(start)
+    while hare != tortoise:
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+        steps += 1
+    counters.add("cycles: steps", steps)
+
+    # Find mu: with the hare length steps ahead of the tortoise, step both
+    # until they meet at the first state of the cycle.
+    tortoise, hare = start, advance(start, step, length)
+    mu = 0
+    while tortoise != hare:
+        tortoise, hare = step(tortoise), step(hare)
+        mu += 1
+    counters.add("cycles: steps", 2 * mu)
+    return Cycle(mu, length, tortoise)
+
+
+def _find_fingerprinted[S](
+    start: S, step: Callable[[S], S], fingerprint: Callable[[S], Hashable]
+) -> Cycle[S] | None:
+    """Find the cycle by remembering the fingerprints of all states.
+
+    This takes mu + length steps to find the first repeated fingerprint, and
+    another mu steps to recompute x(mu), and verify that its state really
+    repeats. Return None if it does not, i.e. fingerprints collided.
+    """
+    seen: dict[Hashable, int] = {}  # fingerprint -> index of first state
+    state, i = start, 0
+    while (key := fingerprint(state)) not in seen:
+        seen[key] = i
+        state, i = step(state), i + 1
+    counters.add("cycles: steps", i)
+    mu = seen[key]
+    entry = advance(start, step, mu)
+    return Cycle(mu, i - mu, entry) if entry == state else None
+
+
+def nth[S](
+    start: S,
+    step: Callable[[S], S],
+    n: int,
+    *,
+    fingerprint: Callable[[S], Hashable] | None = None,
+) -> S:
+    """Return x(n), skipping the whole cycles between x(mu) and x(n)."""
+    cycle = find(start, step, fingerprint=fingerprint)
+    if n < cycle.mu:
+        return advance(start, step, n)
+    return advance(cycle.entry, step, (n - cycle.mu) % cycle.length)
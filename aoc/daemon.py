@@ -0,0 +1,161 @@
+"""Keep the days imported in a long-running process, and solve on request.
+
+Start the daemon with `python -m aoc.daemon serve`. It imports all days (and
+thus their heavy dependencies, like sympy) up front, and then listens on a
+Unix socket. `python -m aoc.daemon run DAY [INPUT]` asks it to solve a day,
+and prints the answers just like running NN.py would. A day is re-imported
+whenever its NN.py has changed since it was last imported. The shared aoc/
+modules cannot be safely re-imported under the days that use them, so once
+any of them has changed, the daemon refuses to solve until it is restarted.
+If the daemon is not running (or refuses), `run` exits with status
+EX_TEMPFAIL (75), so that the caller can run NN.py itself instead.
+
+Requests and responses are single lines of JSON:
+    {"day": "24", "input": "..."}
+    {"output": "<answers, one per line>", "elapsed": 0.123}
+    {"error": "Traceback ..."}  (if solving failed)
+    {"stale": "aoc/grid.py changed since the daemon started"}
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import time
+import traceback
+from pathlib import Path
+from types import ModuleType
+
+from aoc.days import load_day, reset_caches
+
+SOCKET = Path(os.environ.get("AOC_SOCKET", ".aoc-daemon.sock"))
+HELPERS = Path(__file__).parent  # the aoc/ package
+
+
+def helper_mtimes() -> dict[Path, float]:
+    return {path: path.stat().st_mtime for path in HELPERS.glob("*.py")}
+
+
+class Days:
+    """Imported days, re-imported when their source file changes."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.modules: dict[str, tuple[float, ModuleType]] = {}
+        self.helpers = helper_mtimes()  # as imported by the days
+
+    def __getitem__(self, stem: str) -> ModuleType:
+        path = self.root / f"{stem}.py"
+        mtime = path.stat().st_mtime
+        if stem not in self.modules or self.modules[stem][0] != mtime:
+            self.modules[stem] = mtime, load_day(path)
+        return self.modules[stem][1]
+
+    def stale_helpers(self) -> list[str]:
+        """Return the aoc/ modules that were changed since they were loaded."""
+        current = helper_mtimes()
+        return [
+            f"{HELPERS.name}/{path.name}"
+            for path in sorted(self.helpers.keys() | current.keys())
+            if self.helpers.get(path) != current.get(path)
+        ]
+
+    def preload(self) -> None:
+        for path in sorted(self.root.glob("??.py")):
+            self[path.stem]
+
+
+class Handler(socketserver.StreamRequestHandler):
+    server: "Server"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            response = self.server.solve(json.loads(line))
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class Server(socketserver.UnixStreamServer):
+    def __init__(self, path: Path, days: Days) -> None:
+        self.days = days
+        super().__init__(str(path), Handler)
+
+    def solve(self, request: dict[str, str]) -> dict[str, str | float]:
+        t_start = time.perf_counter()
+        if stale := self.days.stale_helpers():
+            changed = ", ".join(stale)
+            return {"stale": f"{changed} changed since the daemon started"}
+        try:
+            day = self.days[request["day"]]
+            reset_caches(day)
+            answers = day.solve(request["input"])
+        except Exception:  # noqa: BLE001
+            return {"error": traceback.format_exc()}
+        return {
+            "output": "".join(f"{answer}\n" for answer in answers),
+            "elapsed": time.perf_counter() - t_start,
+        }
+
+
+def serve(path: Path) -> None:
+    days = Days(Path.cwd())
+    days.preload()
+    path.unlink(missing_ok=True)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)  # clean up
+    with Server(path, days) as server:
+        print(f"Serving {len(days.modules)} days on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def request(path: Path, day: str, text: str) -> dict[str, str | float]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        with sock.makefile("rwb") as f:
+            f.write(json.dumps({"day": day, "input": text}).encode() + b"\n")
+            f.flush()
+            return json.loads(f.readline())  # type: ignore[no-any-return]
+
+
+def run(day: str, input_file: Path) -> int:
+    try:
+        text = input_file.read_text()
+    except OSError as e:
+        print(f"Cannot read input: {e}", file=sys.stderr)
+        return os.EX_NOINPUT
+    try:
+        response = request(SOCKET, day, text)
+    except (ConnectionRefusedError, FileNotFoundError):
+        print(f"No daemon is listening on {SOCKET}", file=sys.stderr)
+        return os.EX_TEMPFAIL
+    if "stale" in response:
+        print(f"Daemon must be restarted: {response['stale']}", file=sys.stderr)
+        return os.EX_TEMPFAIL
+    if "error" in response:
+        print(response["error"], end="", file=sys.stderr)
+        return 1
+    print(response["output"], end="")
+    return 0
+
+
+def main() -> int:
+    match sys.argv[1:]:
+        case ["serve"]:
+            serve(SOCKET)
+        case ["run", day]:
+            return run(day, Path(f"{day}.input"))
+        case ["run", day, input_file]:
+            return run(day, Path(input_file))
+        case _:
+            print(f"Usage: {sys.argv[0]} serve | run DAY [INPUT]")
+            return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
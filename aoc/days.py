@@ -0,0 +1,36 @@
+"""Import the daily solutions as modules."""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+from aoc import memo
+
+
+def load_day(path: Path) -> ModuleType:
+    """Import NN.py as module "dayNN", without running its __main__ block."""
+    spec = importlib.util.spec_from_file_location(f"day{path.stem}", path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # needed by dataclasses, pickle, etc.
+    spec.loader.exec_module(module)
+    return module
+
+
+def reset_caches(day: ModuleType) -> None:
+    """Clear any memoization caches in the day, so each run starts cold."""
+    for obj in vars(day).values():
+        if callable(cache_clear := getattr(obj, "cache_clear", None)):
+            cache_clear()
+            memo.forget(obj)
+
+
+def cache_stats(day: ModuleType) -> dict[str, memo.Info]:
+    """Return statistics for the memoized functions in the day, by name."""
+    return {
+        name: memo.info(obj)
+        for name, obj in vars(day).items()
+        if callable(getattr(obj, "cache_info", None))
+    }
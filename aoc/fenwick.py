@@ -0,0 +1,45 @@
+"""Fenwick trees (binary indexed trees): prefix sums under point updates.
+
+A Fenwick tree over n cells stores, at each 1-based index i, the sum of the
+i & -i cells ending at i. Both adding to a cell and summing a prefix of the
+cells then only touch O(log n) of these entries. In two dimensions, the same
+is done along both axes, for O(log w * log h) per operation. The 2-D tree is
+kept in one flat list, row by row.
+"""
+
+
+class Fenwick2D:
+    """Sums of ints in a width x height grid, over rectangles from (0, 0)."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.tree = [0] * ((width + 1) * (height + 1))
+
+    def add(self, x: int, y: int, value: int) -> None:
+        """Add value to cell (x, y)."""
+        assert 0 <= x < self.width
+        assert 0 <= y < self.height
+        stride = self.height + 1
+        i = x + 1
+        while i <= self.width:
+            j = y + 1
+            while j <= self.height:
+                self.tree[i * stride + j] += value
+                j += j & -j
+            i += i & -i
+
+    def prefix_sum(self, x: int, y: int) -> int:
+        """Return the sum of the cells in [0, x) x [0, y)."""
+        assert 0 <= x <= self.width
+        assert 0 <= y <= self.height
+        stride = self.height + 1
+        total = 0
+        i = x
+        while i > 0:
+            j = y
+            while j > 0:
+                total += self.tree[i * stride + j]
+                j -= j & -j
+            i -= i & -i
+        return total
@@ -0,0 +1,585 @@
+"""Generate synthetic puzzle inputs of a requested size.
+
+Each day has a generator that takes a size and a random number generator,
+and returns the text of a valid input for that day. What "size" means
+depends on the day (number of lines, grid width, number of bricks, ...),
+see the `unit` of each registered generator.
+
+Run as `python -m aoc.generate DAY SIZE [SEED]` to print an input.
+"""
+
+import string
+import sys
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from itertools import count, islice, pairwise, product
+from math import isqrt
+from random import Random
+
+Generator = Callable[[int, Random], str]
+
+
+@dataclass(frozen=True)
+class DayGenerator:
+    func: Generator
+    unit: str  # what the size means
+    sizes: list[int]  # default sizes for a sweep
+
+
+GENERATORS: dict[str, DayGenerator] = {}
+
+
+def generator(
+    stem: str, unit: str, sizes: list[int]
+) -> Callable[[Generator], Generator]:
+    def register(func: Generator) -> Generator:
+        GENERATORS[stem] = DayGenerator(func, unit, sizes)
+        return func
+
+    return register
+
+
+def generate(stem: str, size: int, seed: int = 0) -> str:
+    return GENERATORS[stem].func(size, Random(f"{stem}/{size}/{seed}"))
+
+
+def names(length: int, alphabet: str = string.ascii_lowercase) -> Iterator[str]:
+    """Generate all strings of the given length from alphabet, in order."""
+    for chars in product(alphabet, repeat=length):
+        yield "".join(chars)
+
+
+def unique_names(n: int, rng: Random, min_len: int = 2) -> list[str]:
+    """Return n distinct random lowercase names, at least min_len long."""
+    length = min_len
+    while 26**length < 2 * n:
+        length += 1
+    ret: set[str] = set()
+    while len(ret) < n:
+        ret.add("".join(rng.choices(string.ascii_lowercase, k=length)))
+    return sorted(ret, key=lambda _: rng.random())
+
+
+def primes(start: int) -> Iterator[int]:
+    for n in count(max(start, 2)):
+        if all(n % d for d in range(2, isqrt(n) + 1)):
+            yield n
+
+
+def lines(rows: Iterator[str] | list[str]) -> str:
+    return "".join(f"{row}\n" for row in rows)
+
+
+@generator("01", "lines", [1_000, 3_000, 10_000])
+def day01(size: int, rng: Random) -> str:
+    words = ["one", "two", "three", "four", "five", "six", "seven", "eight"]
+    words += ["nine"]
+
+    def line() -> str:
+        chunks = [str(rng.randint(1, 9))]  # at least one numeric digit
+        for _ in range(rng.randint(1, 8)):
+            chunks.append(rng.choice([*words, str(rng.randint(1, 9))]))
+            letters = rng.choices(string.ascii_lowercase, k=rng.randint(0, 5))
+            chunks.append("".join(letters))
+        rng.shuffle(chunks)
+        return "".join(chunks)
+
+    return lines(line() for _ in range(size))
+
+
+@generator("02", "games", [1_000, 3_000, 10_000])
+def day02(size: int, rng: Random) -> str:
+    def draw() -> str:
+        colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+        return ", ".join(f"{rng.randint(1, 20)} {color}" for color in colors)
+
+    return lines(
+        f"Game {i}: " + "; ".join(draw() for _ in range(rng.randint(1, 6)))
+        for i in range(1, size + 1)
+    )
+
+
+@generator("03", "grid width", [100, 200, 400])
+def day03(size: int, rng: Random) -> str:
+    def row() -> str:
+        chars: list[str] = []
+        while len(chars) < size:
+            r = rng.random()
+            if r < 0.1:  # number, followed by a separator
+                chars.extend(str(rng.randint(1, 999)))
+                chars.append(".")
+            elif r < 0.15:
+                chars.append(rng.choice("*#+$/@=%&-"))
+            else:
+                chars.append(".")
+        return "".join(chars[:size]).rstrip("0123456789").ljust(size, ".")
+
+    return lines(row() for _ in range(size))
+
+
+@generator("04", "cards", [1_000, 3_000, 10_000])
+def day04(size: int, rng: Random) -> str:
+    # Keep the average number of matches low, so that the number of won
+    # cards in part 2 does not explode.
+    def card(i: int) -> str:
+        matches = 0 if rng.random() < 0.85 else rng.randint(1, 10)
+        winning = rng.sample(range(1, 100), 10)
+        others = [n for n in range(1, 100) if n not in winning]
+        have = winning[:matches] + rng.sample(others, 25 - matches)
+        rng.shuffle(have)
+        return (
+            f"Card {i:3}: "
+            + " ".join(f"{n:2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:2}" for n in have)
+        )
+
+    return lines(card(i) for i in range(1, size + 1))
+
+
+@generator("05", "ranges per map", [10, 30, 100])
+def day05(size: int, rng: Random) -> str:
+    kinds = ["seed", "soil", "fertilizer", "water", "light", "temperature"]
+    kinds += ["humidity", "location"]
+    total = size * 1_000_000
+    seeds = [rng.randrange(total) for _ in range(10)]
+    seed_ranges = []
+    for start in seeds:
+        seed_ranges += [start, rng.randint(1, total - start)]
+    out = ["seeds: " + " ".join(map(str, seed_ranges)), ""]
+    for src, dst in pairwise(kinds):
+        # Partition [0, total) into ranges, and map them to a shuffled order
+        cuts = sorted(rng.sample(range(1, total), size - 1))
+        lengths = [
+            b - a for a, b in zip([0, *cuts], [*cuts, total], strict=True)
+        ]
+        starts = [0, *cuts]
+        order = list(range(size))
+        rng.shuffle(order)
+        dst_start = rng.randrange(total)
+        mapping = {}
+        for i in order:
+            mapping[i] = dst_start
+            dst_start += lengths[i]
+        out.append(f"{src}-to-{dst} map:")
+        out += [f"{mapping[i]} {starts[i]} {lengths[i]}" for i in order]
+        out.append("")
+    return lines(out[:-1])
+
+
+@generator("06", "races", [10, 30, 60])
+def day06(size: int, rng: Random) -> str:
+    # Keep the concatenated part 2 numbers small enough for float math
+    times = [rng.randint(40, 99) for _ in range(min(size, 70))]
+    records = [
+        rng.randint(1, min(999, (t // 2) * (t - t // 2) - 1)) for t in times
+    ]
+    return lines(
+        [
+            "Time:     " + " ".join(f"{t:4}" for t in times),
+            "Distance: " + " ".join(f"{r:4}" for r in records),
+        ]
+    )
+
+
+@generator("07", "hands", [1_000, 3_000, 10_000])
+def day07(size: int, rng: Random) -> str:
+    return lines(
+        "".join(rng.choices("23456789TJQKA", k=5)) + f" {rng.randint(1, 999)}"
+        for _ in range(size)
+    )
+
+
+@generator("08", "nodes", [1_000, 3_000, 10_000])
+def day08(size: int, rng: Random) -> str:
+    # Each ghost walks its own chain of nodes from ..A to ..Z and then loops
+    # back to the start of the chain, with a period that is a multiple of the
+    # instruction length. This is the structure that part 2 relies on.
+    # Node names have 3 letters, which limits the size to ~16000 nodes.
+    ghosts = 6
+    recipe_len = rng.choice([11, 13, 17, 19, 23, 29, 31])
+    per_ghost = max(2, min(size, 15_000) // (ghosts * recipe_len))
+    multipliers = list(islice(primes(per_ghost), ghosts))
+    upper = string.ascii_uppercase
+    pool = [
+        prefix + last
+        for prefix in names(2, upper)
+        for last in upper[1:-1]  # internal nodes end with neither A nor Z
+    ]
+    rng.shuffle(pool)
+    internal = iter(pool)
+    prefixes = [p for p in names(2, upper) if p not in {"AA", "ZZ"}]
+    starts = ["AA", *rng.sample(prefixes, ghosts - 1)]
+    nodes: dict[str, tuple[str, str]] = {}
+    for i, (start, mult) in enumerate(zip(starts, multipliers, strict=True)):
+        end = "ZZZ" if i == 0 else start + "Z"
+        chain = [next(internal) for _ in range(mult * recipe_len - 1)]
+        path = [start + "A", *chain, end]
+        for a, b in pairwise(path):
+            nodes[a] = (b, b)
+        nodes[end] = (chain[0], chain[0])
+    recipe = "".join(rng.choices("LR", k=recipe_len))
+    items = list(nodes.items())
+    rng.shuffle(items)
+    return lines([recipe, ""] + [f"{n} = ({a}, {b})" for n, (a, b) in items])
+
+
+@generator("09", "sequences", [1_000, 3_000, 10_000])
+def day09(size: int, rng: Random) -> str:
+    def sequence() -> str:
+        coeffs = [rng.randint(-5, 5) for _ in range(rng.randint(1, 7))]
+        return " ".join(
+            str(sum(c * x**i for i, c in enumerate(coeffs))) for x in range(21)
+        )
+
+    return lines(sequence() for _ in range(size))
+
+
+@generator("10", "grid width", [50, 100, 200])
+def day10(size: int, rng: Random) -> str:
+    # A loop running around the grid, with random "teeth" going down from the
+    # top edge. S is placed in the top left corner.
+    height = width = max(size, 8)
+    cells = [(y, 1) for y in range(1, height - 1)]
+    cells += [(height - 2, x) for x in range(2, width - 1)]
+    cells += [(y, width - 2) for y in range(height - 3, 0, -1)]
+    x = width - 3
+    while x > 1:
+        if x - 1 >= 2 and rng.random() < 0.7:  # tooth: down at x, up at x-1
+            depth = rng.randint(2, height - 4)
+            cells += [(y, x) for y in range(1, depth + 1)]
+            cells += [(y, x - 1) for y in range(depth, 0, -1)]
+            x -= 2
+        else:
+            cells.append((1, x))
+            x -= 1
+    dirs = {(-1, 0): "N", (1, 0): "S", (0, 1): "E", (0, -1): "W"}
+    pipes = {"NS": "|", "EW": "-", "EN": "L", "ES": "F", "SW": "7", "NW": "J"}
+    grid = [
+        [
+            "."
+            if y in {0, height - 1} or x in {0, width - 1}
+            else rng.choice("|-LJ7F....")
+            for x in range(width)
+        ]
+        for y in range(height)
+    ]
+    for i, (y, x) in enumerate(cells):
+        (py, px), (ny, nx) = cells[i - 1], cells[(i + 1) % len(cells)]
+        d = sorted(dirs[py - y, px - x] + dirs[ny - y, nx - x])
+        grid[y][x] = pipes["".join(d)]
+    grid[1][1] = "S"
+    return lines("".join(row) for row in grid)
+
+
+@generator("11", "grid width", [100, 200, 400])
+def day11(size: int, rng: Random) -> str:
+    empty_rows = set(rng.sample(range(size), size // 20))
+    empty_cols = set(rng.sample(range(size), size // 20))
+    return lines(
+        "".join(
+            "#"
+            if y not in empty_rows
+            and x not in empty_cols
+            and rng.random() < 0.02
+            else "."
+            for x in range(size)
+        )
+        for y in range(size)
+    )
+
+
+@generator("12", "rows", [100, 300, 1_000])
+def day12(size: int, rng: Random) -> str:
+    def row() -> str:
+        springs = rng.choices("#.", k=rng.randint(5, 20))
+        springs[rng.randrange(len(springs))] = "#"  # at least one group
+        groups = [len(g) for g in "".join(springs).split(".") if g]
+        masked = "".join("?" if rng.random() < 0.5 else c for c in springs)
+        return masked + " " + ",".join(map(str, groups))
+
+    return lines(row() for _ in range(size))
+
+
+@generator("13", "patterns", [100, 300, 1_000])
+def day13(size: int, rng: Random) -> str:
+    # Each pattern has a vertical reflection at column c, and a horizontal
+    # reflection at row r that is broken by a single smudge, placed in the
+    # columns outside the vertical reflection.
+    def pattern() -> str:
+        height = rng.randint(7, 17)
+        mirror_c = rng.randint(1, 4)
+        width = 2 * mirror_c + rng.randint(1, 7)
+        mirror_r = rng.randint(1, height - 1)
+
+        def row() -> list[str]:
+            left = rng.choices("#.", k=mirror_c)
+            tail = rng.choices("#.", k=width - 2 * mirror_c)
+            return left + left[::-1] + tail
+
+        rows = [row() for _ in range(height)]
+        reflected = min(mirror_r, height - mirror_r)
+        for i in range(reflected):
+            rows[mirror_r + i] = list(rows[mirror_r - 1 - i])
+        i = rng.randrange(reflected)
+        x = rng.randrange(2 * mirror_c, width)
+        rows[mirror_r + i][x] = "#" if rows[mirror_r + i][x] == "." else "."
+        return "\n".join("".join(r) for r in rows)
+
+    return "\n\n".join(pattern() for _ in range(size)) + "\n"
+
+
+@generator("14", "grid width", [25, 50, 100])
+def day14(size: int, rng: Random) -> str:
+    return lines(
+        "".join(rng.choices("O#.", weights=[20, 15, 65], k=size))
+        for _ in range(size)
+    )
+
+
+@generator("15", "steps", [1_000, 3_000, 10_000])
+def day15(size: int, rng: Random) -> str:
+    labels = unique_names(max(1, size // 4), rng)
+
+    def step() -> str:
+        label = rng.choice(labels)
+        return (
+            f"{label}-"
+            if rng.random() < 0.3
+            else f"{label}={rng.randint(1, 9)}"
+        )
+
+    return ",".join(step() for _ in range(size)) + "\n"
+
+
+@generator("16", "grid width", [25, 50, 100])
+def day16(size: int, rng: Random) -> str:
+    return lines(
+        "".join(rng.choices(".|-/\\", weights=[80, 5, 5, 5, 5], k=size))
+        for _ in range(size)
+    )
+
+
+@generator("17", "grid width", [25, 50, 100])
+def day17(size: int, rng: Random) -> str:
+    return lines("".join(rng.choices("123456789", k=size)) for _ in range(size))
+
+
+@generator("18", "top edge steps", [100, 300, 1_000])
+def day18(size: int, rng: Random) -> str:
+    # Both dig plans trace a histogram: up from the origin, along a stepped
+    # top edge to the right, then down and back left along the bottom.
+    def histogram(max_width: int, max_height: int) -> list[tuple[str, int]]:
+        heights = [rng.randint(1, max_height)]
+        while len(heights) < size:
+            h = rng.randint(1, max_height)
+            if h != heights[-1]:
+                heights.append(h)
+        widths = [rng.randint(1, max_width) for _ in heights]
+        plan = [("U", heights[0])]
+        for i, width in enumerate(widths):
+            plan.append(("R", width))
+            if i + 1 < len(heights):
+                delta = heights[i + 1] - heights[i]
+                plan.append(("U" if delta > 0 else "D", abs(delta)))
+        plan += [("D", heights[-1]), ("L", sum(widths))]
+        return plan
+
+    part1 = histogram(10, 10)
+    part2 = histogram(0xFFFFF // size, 0xFFFFF)
+    digit = {"R": 0, "D": 1, "L": 2, "U": 3}
+    return lines(
+        f"{d1} {n1} (#{n2:05x}{digit[d2]})"
+        for (d1, n1), (d2, n2) in zip(part1, part2, strict=True)
+    )
+
+
+@generator("19", "workflows", [100, 300, 1_000])
+def day19(size: int, rng: Random) -> str:
+    # Workflows form a tree rooted at "in". Each condition splits the range
+    # of values that can reach it, so that no path ends up with empty ranges.
+    wf_names = ["in"] + [n for n in unique_names(size, rng) if n != "in"]
+    pending = iter(wf_names[1:size])
+    queue = deque([("in", dict.fromkeys("xmas", (1, 4001)))])
+    workflows = []
+    while queue:
+        name, spans = queue.popleft()
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            splittable = [v for v, (lo, hi) in spans.items() if hi - lo > 2]
+            if not splittable:
+                break
+            var = rng.choice(splittable)
+            lo, hi = spans[var]
+            dst = next(pending, None) or rng.choice("AR")
+            if rng.random() < 0.5:
+                val = rng.randint(lo + 1, hi - 1)
+                rules.append(f"{var}<{val}:{dst}")
+                true_span, spans[var] = (lo, val), (val, hi)
+            else:
+                val = rng.randint(lo, hi - 2)
+                rules.append(f"{var}>{val}:{dst}")
+                true_span, spans[var] = (val + 1, hi), (lo, val + 1)
+            if dst not in "AR":
+                queue.append((dst, spans | {var: true_span}))
+        dst = next(pending, None) or rng.choice("AR")
+        rules.append(dst)
+        if dst not in "AR":
+            queue.append((dst, dict(spans)))
+        workflows.append(f"{name}{{{','.join(rules)}}}")
+    rng.shuffle(workflows)
+    parts = [
+        "{" + ",".join(f"{v}={rng.randint(1, 4000)}" for v in "xmas") + "}"
+        for _ in range(size)
+    ]
+    return lines([*workflows, "", *parts])
+
+
+@generator("20", "counter networks", [2, 4, 8])
+def day20(size: int, rng: Random) -> str:
+    # Each network is a 12-bit counter of flip-flops that feeds a conjunction
+    # once it reaches a (prime) count, as analyzed in 20.py.
+    bits = 12
+    periods = rng.sample(list(islice(primes(2 ** (bits - 1)), 100)), size)
+    mod_names = iter(n for n in unique_names(size * 14 + 1, rng) if n != "rx")
+    final = next(mod_names)
+    out = []
+    starts = []
+    for period in periods:
+        flops = [next(mod_names) for _ in range(bits)]
+        conj, inverter = next(mod_names), next(mod_names)
+        starts.append(flops[0])
+        for i, flop in enumerate(flops):
+            outputs = flops[i + 1 : i + 2]
+            if period & (1 << i):
+                outputs.append(conj)
+            out.append(f"%{flop} -> {', '.join(outputs)}")
+        resets = [f for i, f in enumerate(flops) if not period & (1 << i)]
+        out.append(f"&{conj} -> {', '.join([flops[0], *resets, inverter])}")
+        out.append(f"&{inverter} -> {final}")
+    out.append(f"&{final} -> rx")
+    out.append(f"broadcaster -> {', '.join(starts)}")
+    rng.shuffle(out)
+    return lines(out)
+
+
+@generator("21", "grid width", [17, 33, 65])
+def day21(size: int, rng: Random) -> str:
+    size |= 1  # odd, so that S is in the middle
+    mid = size // 2
+
+    def cell(y: int, x: int) -> str:
+        if y == x == mid:
+            return "S"
+        if y in {0, mid, size - 1} or x in {0, mid, size - 1}:
+            return "."
+        return "#" if rng.random() < 0.1 else "."
+
+    return lines("".join(cell(y, x) for x in range(size)) for y in range(size))
+
+
+@generator("22", "bricks", [50, 100, 200])
+def day22(size: int, rng: Random) -> str:
+    # Bricks are stacked at increasing heights, so that none overlap before
+    # they settle.
+    z = 1
+    out = []
+    for _ in range(size):
+        x, y = rng.randrange(10), rng.randrange(10)
+        dx = dy = dz = 0
+        match rng.choice("xyzc"):
+            case "x":
+                dx = rng.randint(1, 3)
+                x = min(x, 9 - dx)
+            case "y":
+                dy = rng.randint(1, 3)
+                y = min(y, 9 - dy)
+            case "z":
+                dz = rng.randint(1, 3)
+        out.append(f"{x},{y},{z}~{x + dx},{y + dy},{z + dz}")
+        z += dz + rng.randint(1, 3)
+    rng.shuffle(out)
+    return lines(out)
+
+
+@generator("23", "junctions per side", [3, 4, 5])
+def day23(size: int, rng: Random) -> str:
+    # Junctions in a size x size lattice, connected by corridors of random
+    # length. Slopes next to each junction only allow moving right/down.
+    spacing = [rng.randint(4, 8) for _ in range(size)]
+    offsets = [sum(spacing[:i]) for i in range(size)]
+    width = offsets[-1] + 3
+    height = offsets[-1] + 5
+    grid = [["#"] * width for _ in range(height)]
+    grid[0][1] = grid[1][1] = grid[height - 2][width - 2] = "."
+    grid[height - 1][width - 2] = "."
+    for i, j in product(range(size), repeat=2):
+        y, x = offsets[i] + 2, offsets[j] + 1
+        grid[y][x] = "."
+        if j + 1 < size:  # corridor to the right
+            end = offsets[j + 1] + 1
+            for xx in range(x + 1, end):
+                grid[y][xx] = "."
+            grid[y][x + 1] = grid[y][end - 1] = ">"
+        if i + 1 < size:  # corridor downwards
+            end = offsets[i + 1] + 2
+            for yy in range(y + 1, end):
+                grid[yy][x] = "."
+            grid[y + 1][x] = grid[end - 1][x] = "v"
+    return lines("".join(row) for row in grid)
+
+
+@generator("24", "hailstones", [50, 100, 200])
+def day24(size: int, rng: Random) -> str:
+    # All hailstones are hit by the same rock, at distinct integer times.
+    def vector(lo: int, hi: int) -> tuple[int, int, int]:
+        while True:
+            v = (rng.randint(lo, hi), rng.randint(lo, hi), rng.randint(lo, hi))
+            if all(v):
+                return v
+
+    rock_pos = vector(100_000_000_000_000, 300_000_000_000_000)
+    rock_vel = vector(-300, 300)
+    times = rng.sample(range(1, 1_000_000_000_000), size)
+    out = []
+    for t in times:
+        vel = vector(-300, 300)
+        while vel[0] == rock_vel[0]:
+            vel = vector(-300, 300)
+        pos = [
+            p + t * (rv - v)
+            for p, rv, v in zip(rock_pos, rock_vel, vel, strict=True)
+        ]
+        out.append(", ".join(map(str, pos)) + " @ " + ", ".join(map(str, vel)))
+    return lines(out)
+
+
+@generator("25", "components", [50, 100, 200])
+def day25(size: int, rng: Random) -> str:
+    # Two random clusters (with minimum degree 4), connected by 3 wires.
+    nodes = unique_names(2 * size, rng, min_len=3)
+    edges: set[tuple[str, str]] = set()
+    for cluster in nodes[:size], nodes[size:]:
+        for i, node in enumerate(cluster):
+            others = cluster[:i] + cluster[i + 1 :]
+            for other in rng.sample(others, min(4, len(others))):
+                edges.add((min(node, other), max(node, other)))
+    for a, b in zip(
+        rng.sample(nodes[:size], 3), rng.sample(nodes[size:], 3), strict=True
+    ):
+        edges.add((a, b))
+    conns: dict[str, list[str]] = {}
+    for a, b in edges:
+        conns.setdefault(a, []).append(b)
+    return lines(f"{a}: {' '.join(bs)}" for a, bs in conns.items())
+
+
+def main() -> None:
+    stem, size, *rest = sys.argv[1:]
+    seed = int(rest[0]) if rest else 0
+    sys.stdout.write(generate(stem, int(size), seed))
+
+
+if __name__ == "__main__":
+    main()
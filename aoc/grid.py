@@ -0,0 +1,96 @@
+"""A 2D grid of characters, stored in a flat bytearray.
+
+Positions in the grid are plain ints (y * stride + x), so that moving around
+is a matter of adding one of the direction offsets, and neighbour lookups do
+not allocate. The grid is surrounded by a border of sentinel cells, so that
+taking a single step from any cell inside the grid stays within the array:
+check for the sentinel instead of checking coordinates.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Self
+
+
+@dataclass(eq=False)  # hash by identity, grids can be used with @cache
+class Grid:
+    cells: bytearray  # including the border
+    height: int  # excluding the border
+    width: int  # excluding the border
+    border: int  # sentinel byte value
+
+    stride: int = field(init=False)
+    N: int = field(init=False)
+    E: int = field(init=False)
+    S: int = field(init=False)
+    W: int = field(init=False)
+    dirs4: tuple[int, int, int, int] = field(init=False)  # N, E, S, W
+    dirs8: tuple[int, ...] = field(init=False)  # clockwise from N
+
+    def __post_init__(self) -> None:
+        self.stride = self.width + 2
+        self.N, self.E, self.S, self.W = -self.stride, 1, self.stride, -1
+        self.dirs4 = (self.N, self.E, self.S, self.W)
+        self.dirs8 = (
+            *(self.N, self.N + self.E, self.E, self.S + self.E),
+            *(self.S, self.S + self.W, self.W, self.N + self.W),
+        )
+        assert len(self.cells) == (self.height + 2) * self.stride
+
+    @classmethod
+    def parse(cls, text: str, border: str = " ") -> Self:
+        rows = [line.rstrip() for line in text.splitlines() if line.strip()]
+        line_lens = {len(row) for row in rows}
+        assert len(line_lens) == 1
+        width = line_lens.pop()
+        edge = border * (width + 2)
+        lines = [edge, *(border + row + border for row in rows), edge]
+        return cls(
+            bytearray("".join(lines), "ascii"), len(rows), width, ord(border)
+        )
+
+    def copy(self) -> Self:
+        return self.__class__(
+            self.cells.copy(), self.height, self.width, self.border
+        )
+
+    def pos(self, y: int, x: int) -> int:
+        """Return position of the cell at row y, column x (0-based)."""
+        return (y + 1) * self.stride + x + 1
+
+    def yx(self, pos: int) -> tuple[int, int]:
+        """Return (row, column) of the given position."""
+        y, x = divmod(pos, self.stride)
+        return y - 1, x - 1
+
+    def __getitem__(self, pos: int) -> str:
+        return chr(self.cells[pos])
+
+    def __setitem__(self, pos: int, c: str) -> None:
+        self.cells[pos] = ord(c)
+
+    def __contains__(self, pos: int) -> bool:
+        """Return True iff pos is inside the grid, and not on the border."""
+        y, x = self.yx(pos)
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    def positions(self) -> Iterator[int]:
+        """Generate all positions inside the grid, row by row."""
+        for y in range(self.height):
+            start = self.pos(y, 0)
+            yield from range(start, start + self.width)
+
+    def find(self, c: str) -> Iterator[int]:
+        """Generate all positions holding the given character."""
+        value = ord(c)
+        pos = self.cells.find(value)
+        while pos >= 0:
+            yield pos
+            pos = self.cells.find(value, pos + 1)
+
+    def row(self, y: int) -> bytes:
+        start = self.pos(y, 0)
+        return bytes(self.cells[start : start + self.width])
+
+    def render(self) -> str:
+        return "\n".join(self.row(y).decode() for y in range(self.height))
@@ -0,0 +1,120 @@
+"""Sets of ints, stored as sorted, disjoint, half-open intervals.
+
+The intervals are kept in one flat, sorted list of boundaries:
+[start0, end0, start1, end1, ...], with each start < end, and each end <
+the next start (touching intervals are merged). A number n is in the set iff
+an odd number of boundaries are <= n, so lookups, inserts, removals and splits
+are found by bisection in O(log n). Updating the list itself is a single slice
+assignment (i.e. a memmove), which stays fast even with millions of intervals.
+Bulk set operations (|, &, -) sweep both boundary lists in O(n + m).
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import batched
+from operator import and_, or_
+from typing import Self
+
+Span = tuple[int, int]  # start, end (exclusive)
+
+
+@dataclass
+class IntervalSet:
+    bounds: list[int] = field(default_factory=list)
+
+    @classmethod
+    def from_spans(cls, spans: Iterable[Span]) -> Self:
+        """Build a set from (start, end) spans, in any order, may overlap."""
+        bounds: list[int] = []
+        for start, end in sorted(spans):
+            if start >= end:
+                continue
+            if bounds and start <= bounds[-1]:  # overlaps/touches previous
+                bounds[-1] = max(bounds[-1], end)
+            else:
+                bounds += (start, end)
+        return cls(bounds)
+
+    def spans(self) -> Iterator[Span]:
+        return batched(self.bounds, 2)  # type: ignore[return-value]
+
+    def __bool__(self) -> bool:
+        return bool(self.bounds)
+
+    def __contains__(self, n: int) -> bool:
+        return bisect_right(self.bounds, n) % 2 == 1
+
+    def size(self) -> int:
+        """Return the number of ints in the set."""
+        return sum(self.bounds[1::2]) - sum(self.bounds[::2])
+
+    def min(self) -> int:
+        return self.bounds[0]
+
+    def max(self) -> int:
+        return self.bounds[-1] - 1
+
+    def add(self, start: int, end: int) -> None:
+        """Add [start, end) to the set, merging with any overlapping spans."""
+        if start >= end:
+            return
+        i = bisect_left(self.bounds, start)
+        j = bisect_right(self.bounds, end)
+        self.bounds[i:j] = [start] * (i % 2 == 0) + [end] * (j % 2 == 0)
+
+    def remove(self, start: int, end: int) -> None:
+        """Remove [start, end) from the set, cutting any overlapping spans."""
+        if start >= end:
+            return
+        i = bisect_left(self.bounds, start)
+        j = bisect_right(self.bounds, end)
+        self.bounds[i:j] = [start] * (i % 2 == 1) + [end] * (j % 2 == 1)
+
+    def clip(self, start: int, end: int) -> Self:
+        """Return the part of the set that lies within [start, end)."""
+        if start >= end:
+            return self.__class__()
+        i = bisect_right(self.bounds, start)
+        j = bisect_left(self.bounds, end)
+        return self.__class__(
+            [start] * (i % 2 == 1) + self.bounds[i:j] + [end] * (j % 2 == 1)
+        )
+
+    def split(self, at: int) -> tuple[Self, Self]:
+        """Split into the numbers below at, and the numbers from at and up."""
+        i = bisect_left(self.bounds, at)
+        j = bisect_right(self.bounds, at)
+        return (
+            self.__class__(self.bounds[:i] + [at] * (i % 2 == 1)),
+            self.__class__([at] * (j % 2 == 1) + self.bounds[j:]),
+        )
+
+    def shift(self, offset: int) -> Self:
+        return self.__class__([n + offset for n in self.bounds])
+
+    def _combine(self, other: Self, keep: Callable[[bool, bool], bool]) -> Self:
+        """Sweep both sets, keep the numbers where keep(in self, in other)."""
+        a, b = self.bounds, other.bounds
+        i = j = 0
+        inside = False
+        bounds = []
+        while i < len(a) or j < len(b):
+            n = a[i] if j == len(b) or (i < len(a) and a[i] < b[j]) else b[j]
+            if i < len(a) and a[i] == n:  # bounds are strictly increasing
+                i += 1
+            if j < len(b) and b[j] == n:
+                j += 1
+            if keep(i % 2 == 1, j % 2 == 1) != inside:
+                inside = not inside
+                bounds.append(n)
+        return self.__class__(bounds)
+
+    def __or__(self, other: Self) -> Self:
+        return self._combine(other, or_)
+
+    def __and__(self, other: Self) -> Self:
+        return self._combine(other, and_)
+
+    def __sub__(self, other: Self) -> Self:
+        return self._combine(other, lambda a, b: a and not b)
@@ -0,0 +1,168 @@
+"""Read puzzle inputs, as text or as raw (memory-mapped) bytes.
+
+Days run as scripts read the path given on the command line ("-" for stdin),
+or their own NN.input by default. Line-oriented days parse raw bytes instead
+of text: the input file is memory-mapped rather than read and decoded, lines()
+walks it as zero-copy memoryview slices, and ints() pulls all integers out of
+a buffer with C-level bytes.translate() and bytes.split(). Their parse() also
+accepts text (as passed by test.py and the daemon), which as_bytes() encodes.
+
+Days that can solve both parts in a single pass over the lines also have a
+stream() function. main_stream() feeds it the input file (or stdin) one line
+at a time, through a plain buffered reader, so memory use does not grow with
+the size of the input.
+
+Days whose answers are sums over independent lines can also be solved with
+main_parallel(): it splits the memory-mapped file into newline-aligned
+chunks, has a pool of processes stream() one chunk each (mapping the file
+themselves, so no input data is copied between processes), and adds up their
+answers. Inputs smaller than a couple of chunks are solved in-process.
+"""
+
+import mmap
+import os
+import sys
+from collections.abc import Buffer, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import pairwise, repeat
+from pathlib import Path
+
+Input = str | Buffer  # text, or raw bytes
+Span = tuple[int, int]  # start, end (exclusive) byte offsets
+Stream = Callable[[Iterable[Buffer]], Iterable[object]]
+Sums = Callable[[Iterable[Buffer]], tuple[int, ...]]
+
+MIN_CHUNK = 4 << 20  # bytes per process, below that a pool is not worth it
+
+# Map every byte that cannot be part of an int to a space
+NOT_INT = bytes(c if c in b"-0123456789" else ord(" ") for c in range(256))
+
+
+def input_path(default: str) -> Path | None:
+    """Return the path given on the command line, or default. None: stdin."""
+    arg = sys.argv[1] if len(sys.argv) > 1 else default
+    return None if arg == "-" else Path(arg)
+
+
+@contextmanager
+def mapped(path: Path | None) -> Iterator[Buffer]:
+    """Memory-map the given file, or read all of stdin if path is None."""
+    if path is None:
+        yield sys.stdin.buffer.read()
+        return
+    with path.open("rb") as f:
+        if not path.stat().st_size:  # cannot mmap an empty file
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def as_bytes(text: Input) -> Buffer:
+    return text.encode() if isinstance(text, str) else text
+
+
+def _finder(data: Buffer) -> Callable[[bytes, int, int], int]:
+    """Return data.find, copying data to bytes if it has no find() method."""
+    return data.find if hasattr(data, "find") else bytes(data).find
+
+
+def lines(
+    data: Buffer, start: int = 0, end: int | None = None
+) -> Iterator[memoryview]:
+    """Generate the lines in data[start:end], without newlines, as views.
+
+    The views are zero-copy, as long as data has a find() method (like bytes
+    and mmap, but unlike memoryview).
+    """
+    view = memoryview(data)
+    find = _finder(data)
+    end = len(view) if end is None else end
+    while start < end:
+        stop = find(b"\n", start, end)
+        if stop < 0:
+            stop = end
+        yield view[start:stop]
+        start = stop + 1
+
+
+def streamed(path: Path | None) -> Iterator[bytes]:
+    """Generate the lines of the given file (or stdin), without newlines."""
+    with sys.stdin.buffer if path is None else path.open("rb") as f:
+        for line in f:
+            yield line.rstrip(b"\n")
+
+
+def chunks(data: Buffer, n: int) -> list[Span]:
+    """Split data into at most n spans of similar size, at line boundaries."""
+    find = _finder(data)
+    size = len(memoryview(data))
+    bounds = [0]
+    for i in range(1, n):
+        newline = find(b"\n", max(size * i // n, bounds[-1]), size)
+        if newline < 0:
+            break
+        bounds.append(newline + 1)
+    bounds.append(size)
+    return [(start, end) for start, end in pairwise(bounds) if start < end]
+
+
+def ints(data: Buffer) -> list[int]:
+    """Return all integers in data, in order.
+
+    Any byte other than a digit or "-" separates integers, so this is only
+    for lines of numbers (with any kind of punctuation between them), where it
+    is faster than a regex.
+    """
+    return list(map(int, bytes(data).translate(NOT_INT).split()))
+
+
+def main(solve: Callable[[str], Iterable[object]], default: str) -> None:
+    """Solve the input given on the command line (or default) as text."""
+    with mapped(input_path(default)) as data:
+        print(*solve(bytes(data).decode()), sep="\n")
+
+
+def main_raw(solve: Callable[[Input], Iterable[object]], default: str) -> None:
+    """Solve the input given on the command line (or default) as raw bytes."""
+    with mapped(input_path(default)) as data:
+        print(*solve(data), sep="\n")
+
+
+def main_stream(stream: Stream, default: str) -> None:
+    """Solve the input given on the command line (or default) line by line."""
+    print(*stream(streamed(input_path(default))), sep="\n")
+
+
+def _sum_chunk(stream: Sums, path: Path, span: Span) -> tuple[int, ...]:
+    """Solve one chunk of the file, in a worker process."""
+    start, end = span
+    with (
+        path.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        return stream(lines(data, start, end))
+
+
+def main_parallel(stream: Sums, default: str) -> None:
+    """Solve the input given on the command line (or default) on all cores.
+
+    Each part's answer must be a sum over the lines of the input.
+    """
+    path = input_path(default)
+    if path is None:  # stdin cannot be mapped by the worker processes
+        main_stream(stream, default)
+        return
+    with mapped(path) as data:
+        size = len(memoryview(data))
+        jobs = min(os.cpu_count() or 1, size // MIN_CHUNK)
+        spans = chunks(data, jobs)
+    if len(spans) <= 1:
+        main_stream(stream, default)
+        return
+    # Only import this (~30ms) when needed, as all days import this module
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    with ProcessPoolExecutor(len(spans)) as pool:
+        sums = pool.map(_sum_chunk, repeat(stream), repeat(path), spans)
+        print(*map(sum, zip(*sums, strict=True)), sep="\n")
@@ -0,0 +1,100 @@
+"""Memoization with optional bounds, scoped resets, and statistics.
+
+@memo() is functools.cache, and @memo(maxsize=N) is functools.lru_cache(N),
+so the memoized function is still called at C speed, and still has the
+usual cache_info() and cache_clear(). In addition:
+
+- @memo(scope="line") registers the cache in a named scope, and
+  reset_scope("line") drops the entries of all caches in that scope (e.g. when
+  moving on to the next input line), while keeping their hit/miss statistics.
+- info(func) returns the statistics accumulated since the last cache_clear(),
+  across scoped resets, including peak size and the number of LRU evictions.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple, Protocol
+
+
+class Info(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None  # None: unbounded
+    size: int  # current number of entries
+    peak: int  # highest number of entries seen at a scoped reset, or now
+    evictions: int  # entries pushed out by maxsize
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class Memoized(Protocol):
+    """A function memoized by functools.cache/lru_cache."""
+
+    def cache_info(self) -> tuple[int, int, int | None, int]: ...
+    def cache_clear(self) -> None: ...
+
+
+@dataclass
+class Carried:
+    """Statistics carried over scoped resets."""
+
+    hits: int = 0
+    misses: int = 0
+    dropped: int = 0  # entries dropped by scoped resets
+    peak: int = 0
+
+
+_carried: dict[Memoized, Carried] = {}
+_scopes: dict[str, list[Memoized]] = defaultdict(list)
+
+
+def memo[**P, R](
+    maxsize: int | None = None, *, scope: str | None = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Memoize, evicting least recently used entries beyond maxsize."""
+
+    def decorate(func: Callable[P, R]) -> Callable[P, R]:
+        cached = lru_cache(maxsize)(func)
+        _carried[cached] = Carried()
+        if scope is not None:
+            _scopes[scope].append(cached)
+        return cached  # type: ignore[return-value]  # keeps P, unlike lru_cache
+
+    return decorate
+
+
+def reset_scope(scope: str) -> None:
+    """Drop the entries of all caches in scope, but keep their statistics."""
+    for cached in _scopes[scope]:
+        hits, misses, _, size = cached.cache_info()
+        carried = _carried[cached]
+        carried.hits += hits
+        carried.misses += misses
+        carried.dropped += size
+        carried.peak = max(carried.peak, size)
+        cached.cache_clear()
+
+
+def forget(cached: Memoized) -> None:
+    """Forget statistics carried over scoped resets, after cache_clear()."""
+    if cached in _carried:
+        _carried[cached] = Carried()
+
+
+def info(cached: Memoized) -> Info:
+    hits, misses, maxsize, size = cached.cache_info()
+    carried = _carried.get(cached, Carried())
+    misses += carried.misses
+    return Info(
+        hits=hits + carried.hits,
+        misses=misses,
+        maxsize=maxsize,
+        size=size,
+        peak=max(carried.peak, size),
+        evictions=misses - carried.dropped - size if maxsize != 0 else 0,
+    )
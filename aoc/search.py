@@ -0,0 +1,221 @@
+"""Graph searches over int-encoded states.
+
+States are plain ints in range(size), so that the distance table can be a
+flat array instead of a dict, and the queues hold ints instead of tuples of
+objects. Use a Codec to pack several small fields (position, direction, ...)
+into one state. The caller describes the graph with a function returning the
+neighbours of a state (for bfs), or (neighbour, cost) pairs (for the others).
+
+All searches accept an optional goal predicate: the search stops as soon as
+a goal state is reached, and returns it in Result.found. Without a goal, the
+whole reachable graph is explored. The number of visited (expanded) and
+pushed (queued) states is added to aoc.counters, per search algorithm.
+"""
+
+import heapq
+import math
+from array import array
+from collections.abc import Callable, Iterable
+from sys import maxsize
+from typing import NamedTuple
+
+from aoc import counters
+
+State = int
+Cost = int
+Distances = array[int]  # indexed by state, UNREACHED if not (yet) reached
+Nbors = Callable[[State], Iterable[State]]
+Edges = Callable[[State], Iterable[tuple[State, Cost]]]
+Goal = Callable[[State], bool]
+
+UNREACHED = maxsize
+
+
+class Result(NamedTuple):
+    dist: Distances
+    found: State | None  # the first goal state reached, if any
+
+    @property
+    def cost(self) -> Cost:
+        """Return the cost of reaching the goal."""
+        assert self.found is not None
+        return self.dist[self.found]
+
+
+class Codec:
+    """Pack tuples of fields, each in range(n) for its n, into single ints."""
+
+    def __init__(self, *sizes: int) -> None:
+        self.sizes = sizes
+        self.size = math.prod(sizes)  # number of possible states
+
+    def encode(self, *fields: int) -> State:
+        state = 0
+        for value, size in zip(fields, self.sizes, strict=True):
+            assert 0 <= value < size
+            state = state * size + value
+        return state
+
+    def decode(self, state: State) -> tuple[int, ...]:
+        fields = []
+        for size in reversed(self.sizes):
+            state, value = divmod(state, size)
+            fields.append(value)
+        return tuple(reversed(fields))
+
+
+def distances(size: int) -> Distances:
+    return array("q", [UNREACHED]) * size
+
+
+def reached(dist: Distances) -> Iterable[tuple[State, Cost]]:
+    """Generate (state, cost) for all states that were reached."""
+    return ((s, d) for s, d in enumerate(dist) if d != UNREACHED)
+
+
+def reachable(starts: Iterable[State], nbors: Nbors, size: int) -> list[State]:
+    """Return all states reachable from the starts, in depth-first order."""
+    seen = bytearray(size)
+    stack = list(starts)
+    found = []
+    popped = 0  # == pushed, as the stack is drained
+    while stack:
+        state = stack.pop()
+        popped += 1
+        if seen[state]:
+            continue
+        seen[state] = 1
+        found.append(state)
+        stack.extend(nbors(state))  # check seen on pop, to stay in C here
+    counters.add("reachable: visited", len(found))
+    counters.add("reachable: pushed", popped)
+    return found
+
+
+def bfs(
+    starts: Iterable[State],
+    nbors: Nbors,
+    size: int,
+    *,
+    goal: Goal | None = None,
+) -> Result:
+    """Breadth-first search, where every step costs 1."""
+    dist = distances(size)
+    queue = list(starts)
+    for state in queue:
+        dist[state] = 0
+    visited = 0
+    found = None
+    for state in queue:  # FIFO: iteration picks up states appended below
+        visited += 1
+        if goal is not None and goal(state):
+            found = state
+            break
+        cost = dist[state] + 1
+        for nxt in nbors(state):
+            if dist[nxt] == UNREACHED:
+                dist[nxt] = cost
+                queue.append(nxt)
+    pushed = len(queue)
+    counters.add("bfs: visited", visited)
+    counters.add("bfs: pushed", pushed)
+    return Result(dist, found)
+
+
+def dial(
+    starts: Iterable[State],
+    edges: Edges,
+    size: int,
+    max_cost: Cost,
+    *,
+    goal: Goal | None = None,
+) -> Result:
+    """Dijkstra with a bucket queue, for small integer edge costs.
+
+    Every edge must cost between 0 and max_cost (inclusive). Only max_cost + 1
+    buckets are needed, as all queued states are within max_cost of the state
+    being expanded.
+    """
+    dist = distances(size)
+    buckets: list[list[State]] = [[] for _ in range(max_cost + 1)]
+    for state in starts:
+        dist[state] = 0
+        buckets[0].append(state)
+    visited = 0
+    pushed = pending = len(buckets[0])
+    cost = 0
+    found = None
+    while pending and found is None:
+        bucket = buckets[cost % len(buckets)]
+        while bucket:
+            state = bucket.pop()
+            pending -= 1
+            if dist[state] != cost:  # already expanded at a lower cost
+                continue
+            visited += 1
+            if goal is not None and goal(state):
+                found = state
+                break
+            for nxt, step in edges(state):
+                new_cost = cost + step
+                if new_cost < dist[nxt]:
+                    dist[nxt] = new_cost
+                    buckets[new_cost % len(buckets)].append(nxt)
+                    pending += 1
+                    pushed += 1
+        cost += 1
+    counters.add("dial: visited", visited)
+    counters.add("dial: pushed", pushed)
+    counters.add("dial: popped", pushed - pending)
+    return Result(dist, found)
+
+
+def dijkstra(
+    starts: Iterable[State],
+    edges: Edges,
+    size: int,
+    *,
+    goal: Goal | None = None,
+) -> Result:
+    """Dijkstra with a binary heap, for any non-negative edge costs.
+
+    This is A* without a heuristic, and is counted as such.
+    """
+    return astar(starts, edges, size, lambda _: 0, goal=goal)
+
+
+def astar(
+    starts: Iterable[State],
+    edges: Edges,
+    size: int,
+    heuristic: Callable[[State], Cost],
+    *,
+    goal: Goal | None = None,
+) -> Result:
+    """Search with A*, the heuristic must never overestimate remaining cost."""
+    dist = distances(size)
+    heap: list[tuple[Cost, Cost, State]] = []  # (estimate, cost, state)
+    for state in starts:
+        dist[state] = 0
+        heap.append((heuristic(state), 0, state))
+    heapq.heapify(heap)
+    visited, pushed = 0, len(heap)
+    found = None
+    while heap:
+        _, cost, state = heapq.heappop(heap)
+        if cost != dist[state]:  # already reached for less
+            continue
+        visited += 1
+        if goal is not None and goal(state):
+            found = state
+            break
+        for nxt, step in edges(state):
+            new_cost = cost + step
+            if new_cost < dist[nxt]:
+                dist[nxt] = new_cost
+                heapq.heappush(heap, (new_cost + heuristic(nxt), new_cost, nxt))
+                pushed += 1
+    counters.add("astar: visited", visited)
+    counters.add("astar: pushed", pushed)
+    counters.add("astar: popped", pushed - len(heap))
+    return Result(dist, found)
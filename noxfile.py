@@ -76,4 +76,23 @@ def format(session: nox.Session) -> None:
 @nox.session
 def tests(session: nox.Session) -> None:
     install(session, f".[{session.name}]")
-    session.run("./test.py", external=True)
+    session.run("./test.py", "--no-cache", *session.posargs, external=True)
+
+
+@nox.session
+def bench(session: nox.Session) -> None:
+    """Benchmark all days, and fail on regressions against the baseline.
+
+    Extra arguments are passed on to ./test.py, e.g. use
+    `nox -s bench -- --tolerance 0.25` to be stricter about regressions, or
+    `nox -s bench -- --update-baseline` to record a new baseline.
+    """
+    install(session, f".[{session.name}]")
+    session.run(
+        "./test.py",
+        "--bench",
+        "--baseline",
+        "bench-baseline.json",
+        *session.posargs,
+        external=True,
+    )
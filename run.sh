@@ -7,6 +7,12 @@ fi
 
 run() {
     echo "--- Running $1:"
+    if test -S "${AOC_SOCKET:-.aoc-daemon.sock}"; then
+        # Let the warm daemon (python3 -m aoc.daemon serve) solve it
+        python3 -m aoc.daemon run "${1%.py}"
+        status=$?
+        test $status -eq 75 || return $status  # 75: no (up-to-date) daemon
+    fi
     python3 "$1"
 }
 
@@ -1,58 +1,1104 @@
 #!/usr/bin/env python3
 
+import argparse
+import cProfile
+import hashlib
+import io
+import json
+import math
+import os
+import pickle
+import pstats
+import re
+import resource
+import statistics
 import subprocess
 import sys
 import time
+import traceback
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from multiprocessing.pool import Pool, ThreadPool
 from pathlib import Path
+from threading import Lock
+from types import ModuleType
+
+from aoc import counters
+from aoc.days import cache_stats, load_day, reset_caches
+from aoc.generate import GENERATORS, generate
+from aoc.memo import Info as CacheInfo
 
 py_files = {p.stem: p for p in Path.cwd().glob("??.py")}
+input_files = {p.stem: p for p in Path.cwd().glob("??.input")}
 expect_files = {p.stem: p for p in Path.cwd().glob("??.expect")}
 
+shared_files = sorted(Path.cwd().glob("aoc/*.py"))
+CACHE_FILE = Path(".test-cache.json")
+PARSE_CACHE_DIR = Path(".parse-cache")
+
+SOLVE_PHASES = ["parse", "part1", "part2"]
+PHASES = ["import", *SOLVE_PHASES, "solve"]  # solve: all of SOLVE_PHASES
+NOISE_FLOOR = 0.01  # seconds; smaller regressions are never reported
+MIN_STACK_TIME = 1e-5  # seconds; shorter stacks are left out of profiles
+MEMORY_NOISE_FLOOR = 2**20  # bytes; smaller regressions are never reported
+
+
+@dataclass(frozen=True)
+class Options:
+    """How to run each day."""
+
+    in_process: bool = False
+    warmup: int = 0  # untimed runs before the timed runs (in-process only)
+    repeat: int = 1  # number of timed runs (in-process only)
+    profile_dir: Path | None = None  # write cProfile output here
+    profile_top: int = 20  # number of functions to print from the profile
+    memory: bool = False  # measure peak memory per phase (in-process only)
+    parse_cache: bool = False  # load parsed inputs from PARSE_CACHE_DIR
+    importtime: bool = False  # measure imports with -X importtime
+    cache_stats: bool = False  # report memoization statistics
+    counters: bool = False  # report aoc.counters
+
+
+@dataclass
+class Result:
+    """Outcome of testing one day, buffered until it can be reported."""
+
+    stem: str
+    retval: int = 0
+    lines: list[str] = field(default_factory=list)
+    duration: float | None = None
+    details: str = ""
+    phases: dict[str, float] = field(default_factory=dict)
+    samples: list[float] = field(default_factory=list)  # w/o import
+    imports: dict[str, float] = field(default_factory=dict)  # per module
+    peak_rss: dict[str, int] = field(default_factory=dict)  # per phase
+    peak_traced: dict[str, int] = field(default_factory=dict)  # per phase
+    caches: dict[str, CacheInfo] = field(default_factory=dict)  # per function
+    counters: dict[str, int] = field(default_factory=dict)
+    error: subprocess.CalledProcessError | None = None
+    stdout: str = ""  # output of a passing day
+    cached: bool = False
+
+    def print(self, s: str = "", end: str = "\n") -> None:
+        self.lines.append(s + end)
+
+    def report(self) -> int:
+        print(f"--- Test day #{self.stem} ---")
+        print("".join(self.lines), end="", flush=True)
+        if self.error is not None:
+            raise self.error
+        return self.retval
+
+
+class Subprocesses:
+    """Track running child processes, so that they can be killed early."""
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.procs: set[subprocess.Popen[str]] = set()
+        self.killed = False
+
+    @contextmanager
+    def run(self, *args: str | Path) -> Iterator[subprocess.Popen[str]]:
+        with self.lock:
+            if self.killed:
+                msg = "aborted"
+                raise RuntimeError(msg)
+            proc = subprocess.Popen(  # noqa: S603
+                args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            self.procs.add(proc)
+        try:
+            with proc:
+                yield proc
+        finally:
+            with self.lock:
+                self.procs.discard(proc)
+
+    def kill_all(self) -> None:
+        with self.lock:
+            self.killed = True
+            for proc in self.procs:
+                proc.kill()
+
+
+subprocesses = Subprocesses()
+
+
+def run_checked(result: Result, *args: str | Path) -> tuple[str, str] | None:
+    """Run the given command, and return its stdout and stderr on success."""
+    with subprocesses.run(*args) as proc:
+        stdout, stderr = proc.communicate()
+    if proc.returncode:
+        result.print("*** STDOUT ***")
+        result.print(stdout, end="")
+        result.print("*** STDERR ***")
+        result.print(stderr, end="")
+        result.print("**************")
+        result.error = subprocess.CalledProcessError(
+            proc.returncode, proc.args, stdout, stderr
+        )
+        return None
+    return stdout, stderr
+
+
+def run_subprocess(result: Result, script: Path) -> str | None:
+    """Run the given day as a script, and return its output."""
+    t_start = time.monotonic()
+    output = run_checked(result, sys.executable, script)
+    t_end = time.monotonic()
+    if output is None:
+        return None
+    result.duration = t_end - t_start
+    result.details = f"{result.duration:.02f}s"
+    return output[0]
+
+
+# Load and solve a day, with markers around the imports done by loading the
+# day (as opposed to the driver itself, or lazy imports while solving). Print
+# the time spent solving last.
+IMPORTTIME_DRIVER = """
+import sys, time
+from pathlib import Path
+from aoc.days import load_day
+print(MARKER, file=sys.stderr, flush=True)
+day = load_day(Path(sys.argv[1]))
+print(MARKER, file=sys.stderr, flush=True)
+t_start = time.perf_counter()
+print(*day.solve(Path(sys.argv[2]).read_text()), sep="\\n")
+print(time.perf_counter() - t_start)
+"""
+IMPORTTIME_MARKER = "--- loading day ---"
+IMPORTTIME_RE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\S+)$")
+
+
+def run_importtime(result: Result, stem: str) -> str | None:
+    """Run the given day under -X importtime, and return its output.
+
+    Record the cumulative import time of each top-level module imported by
+    the day in result.imports, and the time spent solving (excluding imports)
+    in result.phases.
+    """
+    driver = IMPORTTIME_DRIVER.replace("MARKER", repr(IMPORTTIME_MARKER))
+    args = [py_files[stem], input_files[stem]]
+    output = run_checked(
+        result, sys.executable, "-X", "importtime", "-c", driver, *args
+    )
+    if output is None:
+        return None
+    stdout, stderr = output
+    _, day_imports, _ = stderr.split(IMPORTTIME_MARKER)
+    for line in day_imports.splitlines():
+        if match := IMPORTTIME_RE.match(line):  # top-level modules only
+            result.imports[match[2]] = int(match[1]) / 1e6
+    answers, _, solve_time = stdout.rstrip("\n").rpartition("\n")
+    result.phases["import"] = sum(result.imports.values())
+    result.phases["solve"] = float(solve_time)
+    result.duration = result.phases["import"] + result.phases["solve"]
+    result.details = (
+        f"{result.phases['solve']:.02f}s"
+        f" (+{result.phases['import']:.02f}s import)"
+    )
+    return answers + "\n"
+
+
+@contextmanager
+def timed(timings: dict[str, float], phase: str) -> Iterator[None]:
+    t_start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = time.perf_counter() - t_start
+
+
+def peak_rss() -> int:
+    """Return the peak resident set size of this process, in bytes."""
+    with suppress(OSError):
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    # No reset available here, so this is the peak since the process started
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
 
-def test(stem: str) -> int:
-    print(f"--- Test day #{stem} ---")
+@contextmanager
+def peak_memory(peaks: dict[str, int] | None, phase: str) -> Iterator[None]:
+    """Record the peak memory use during this phase in peaks[phase].
+
+    When tracemalloc is tracing, record the peak of traced allocations.
+    Otherwise, record the peak RSS (resetting it first, where supported).
+    """
+    if peaks is None:
+        yield
+        return
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    else:
+        with suppress(OSError):  # Linux only: reset VmHWM to current RSS
+            Path("/proc/self/clear_refs").write_text("5")
+    try:
+        yield
+    finally:
+        if tracemalloc.is_tracing():
+            peaks[phase] = tracemalloc.get_traced_memory()[1]
+        else:
+            peaks[phase] = peak_rss()
+
+
+def content_hash(paths: list[Path], extra: bytes = b"") -> str:
+    """Hash the interpreter version, the given files and any extra data."""
+    digest = hashlib.sha256(sys.version.encode())
+    for path in paths:
+        digest.update(path.name.encode() + b"\0" + path.read_bytes())
+    digest.update(extra)
+    return digest.hexdigest()
+
+
+def parse_cached(day: ModuleType, text: str) -> object:
+    """Load the day's parsed input from PARSE_CACHE_DIR, or parse and save it.
+
+    The parsed structure is pickled, keyed by a hash of the input and the
+    code that produced it. Days whose parsed input cannot be pickled are
+    simply parsed every time.
+    """
+    stem = day.__name__.removeprefix("day")
+    key = content_hash([py_files[stem], *shared_files], text.encode())
+    path = PARSE_CACHE_DIR / f"{stem}-{key[:16]}.pickle"
+    with suppress(FileNotFoundError):
+        return pickle.loads(path.read_bytes())  # noqa: S301 (our own cache)
+    parsed = day.parse(text)
+    with suppress(pickle.PicklingError, TypeError, AttributeError):
+        data = pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+        PARSE_CACHE_DIR.mkdir(exist_ok=True)
+        path.write_bytes(data)
+    return parsed
+
+
+def run_phases(
+    day: ModuleType,
+    text: str,
+    timings: dict[str, float],
+    peaks: dict[str, int] | None = None,
+    *,
+    parse_cache: bool = False,
+) -> list[object]:
+    """Run the day's parse/part1/part2 phases and return the answers."""
+    reset_caches(day)
+    counters.reset()
+    with timed(timings, "parse"), peak_memory(peaks, "parse"):
+        parsed = parse_cached(day, text) if parse_cache else day.parse(text)
+    answers = []
+    for part in ["part1", "part2"]:
+        if hasattr(day, part):  # day 25 has no part 2
+            with timed(timings, part), peak_memory(peaks, part):
+                answers.append(getattr(day, part)(parsed))
+    return answers
+
+
+Func = tuple[str, int, str]  # (filename, lineno, name), as used by pstats
+
+
+def write_collapsed(stats: pstats.Stats, path: Path) -> None:
+    """Write profile as collapsed stacks ("a;b;c <microseconds>" lines).
+
+    cProfile only records caller -> callee edges, not full stacks, so each
+    function's time is split across its call paths in proportion to the time
+    spent in each edge. Recursive calls are folded into the outer call, and
+    paths taking less than MIN_STACK_TIME are dropped.
+    """
+    raw = stats.stats  # type: ignore[attr-defined]
+    self_time: dict[Func, float] = {}
+    total_time: dict[Func, float] = {}
+    callees: dict[Func, dict[Func, float]] = {}
+    for func, (_, _, tt, ct, callers) in raw.items():
+        self_time[func], total_time[func] = tt, ct
+        for caller, (_, _, _, edge_time) in callers.items():
+            callees.setdefault(caller, {})[func] = edge_time
+    stacks: dict[str, float] = {}
+
+    def walk(func: Func, stack: tuple[Func, ...], fraction: float) -> None:
+        stack = (*stack, func)
+        key = ";".join(
+            f"{name} ({Path(filename).name}:{lineno})"
+            for filename, lineno, name in stack
+        )
+        stacks[key] = stacks.get(key, 0) + self_time[func] * fraction
+        for callee, edge_time in callees.get(func, {}).items():
+            if callee in stack or edge_time * fraction < MIN_STACK_TIME:
+                continue
+            walk(callee, stack, edge_time * fraction / total_time[callee])
+
+    for func, (*_, callers) in raw.items():
+        if not callers:
+            walk(func, (), 1.0)
+    path.write_text(
+        "".join(
+            f"{key} {round(t * 1e6)}\n"
+            for key, t in stacks.items()
+            if t >= MIN_STACK_TIME
+        )
+    )
+
+
+def profile_phases(
+    result: Result,
+    day: ModuleType,
+    text: str,
+    timings: dict[str, float],
+    options: Options,
+) -> list[object]:
+    """Run the day's phases under cProfile, and save/print the profile."""
+    assert options.profile_dir is not None
+    with cProfile.Profile() as profile:
+        answers = run_phases(
+            day, text, timings, parse_cache=options.parse_cache
+        )
+    options.profile_dir.mkdir(parents=True, exist_ok=True)
+    pstats_path = options.profile_dir / f"{result.stem}.pstats"
+    collapsed_path = options.profile_dir / f"{result.stem}.collapsed"
+    profile.dump_stats(pstats_path)
+    stream = io.StringIO()
+    stats = pstats.Stats(profile, stream=stream)
+    write_collapsed(stats, collapsed_path)
+    stats.strip_dirs().sort_stats("cumulative").print_stats(options.profile_top)
+    result.print(stream.getvalue().strip("\n"))
+    result.print(f"  - profile written to {pstats_path} and {collapsed_path}")
+    return answers
+
+
+def run_in_process(result: Result, stem: str, options: Options) -> str | None:
+    """Import the given day and run its phases, return formatted answers.
+
+    Rather than calling the day's solve(), we call its parse(), part1() and
+    part2() functions separately, and record the time taken by each of them
+    (as well as the time taken to import the day) in result.phases.
+
+    With options.repeat > 1, the phases are run repeatedly, every run is
+    recorded in result.samples, and result.phases holds the median timings.
+
+    With options.memory, the phases are run twice more after the timed runs,
+    to record peak RSS and peak traced memory per phase (neither measurement
+    is allowed to disturb the other, or the timings).
+    """
+    runs: list[dict[str, float]] = []
+    counters.enable(on=options.counters)
+    try:
+        with timed(result.phases, "import"):
+            day = load_day(py_files[stem])
+        text = input_files[stem].read_text()
+        for _ in range(options.warmup):
+            run_phases(day, text, {}, parse_cache=options.parse_cache)
+        for _ in range(options.repeat):
+            runs.append({})
+            if options.profile_dir is None:
+                answers = run_phases(
+                    day, text, runs[-1], parse_cache=options.parse_cache
+                )
+            else:
+                answers = profile_phases(result, day, text, runs[-1], options)
+        if options.cache_stats:  # from the last run
+            result.caches = cache_stats(day)
+        result.counters = counters.snapshot()  # from the last run
+        if options.memory:
+            measure_memory(result, day, text, options)
+    except Exception:  # noqa: BLE001
+        result.print("*** EXCEPTION ***")
+        result.print(traceback.format_exc(), end="")
+        result.print("*****************")
+        result.retval = 4
+        return None
+    for phase in runs[0]:
+        result.phases[phase] = statistics.median(run[phase] for run in runs)
+    result.samples = [sum(run.values()) for run in runs]
+    result.duration = result.phases["import"] + statistics.median(
+        result.samples
+    )
+    result.details = (
+        f"{statistics.median(result.samples):.02f}s"
+        f" (+{result.phases['import']:.02f}s import)"
+    )
+    if len(result.samples) > 1:
+        stats = sample_stats(result.samples)
+        result.details += ", " + ", ".join(
+            f"{name} {value:.03f}s" for name, value in stats.items()
+        )
+        result.details += f" over {len(result.samples)} runs"
+    if result.peak_traced:
+        result.details += (
+            f", peak memory {max(result.peak_traced.values()) / 2**20:.01f}MB"
+            f" traced, {max(result.peak_rss.values()) / 2**20:.01f}MB RSS"
+        )
+    return "".join(f"{answer}\n" for answer in answers)
+
+
+def measure_memory(
+    result: Result, day: ModuleType, text: str, options: Options
+) -> None:
+    cache = options.parse_cache
+    run_phases(day, text, {}, result.peak_rss, parse_cache=cache)
+    tracemalloc.start()
+    try:
+        run_phases(day, text, {}, result.peak_traced, parse_cache=cache)
+    finally:
+        tracemalloc.stop()
+
+
+def sample_stats(samples: list[float]) -> dict[str, float]:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def test(stem: str, options: Options) -> Result:
+    result = Result(stem)
     try:
         script = py_files[stem]
     except KeyError:
-        print(f"Missing Python file for day #{stem}!")
-        return 2
+        result.print(f"Missing Python file for day #{stem}!")
+        result.retval = 2
+        return result
     try:
         expect = expect_files[stem].read_text()
     except KeyError:
-        print(f"Missing expected output for day #{stem}!")
-        return 3
+        result.print(f"Missing expected output for day #{stem}!")
+        result.retval = 3
+        return result
 
-    t_start = time.monotonic()
+    if options.importtime:
+        stdout = run_importtime(result, stem)
+    elif options.in_process:
+        stdout = run_in_process(result, stem, options)
+    else:
+        stdout = run_subprocess(result, script)
+    if stdout is None:
+        return result
+    if stdout != expect:
+        result.print(f"*** Test failed for day #{stem}!")
+        result.print(f"    EXPECTED: {expect!r}")
+        result.print(f"     BUT GOT: {stdout!r}")
+        result.retval = 1
+        return result
+    result.stdout = stdout
+    result.print(stdout, end="")
+    result.print(f"  - took {result.details}")
+    return result
+
+
+class ResultCache:
+    """Remember the output of days that passed, keyed by what they depend on.
+
+    The key is a hash of the interpreter version, the day's script and input
+    and the shared sources in aoc/. A cached output is only reused if it
+    still matches the day's expected output.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[str, dict[str, str]] = (
+            json.loads(path.read_text()) if path.exists() else {}
+        )
+        self.keys: dict[str, str] = {}
+
+    def key(self, stem: str) -> str | None:
+        if stem not in py_files or stem not in input_files:
+            return None
+        return content_hash([py_files[stem], input_files[stem], *shared_files])
+
+    def lookup(self, stem: str) -> Result | None:
+        key = self.key(stem)
+        if key is None or stem not in expect_files:
+            return None
+        self.keys[stem] = key
+        entry = self.entries.get(stem)
+        if entry is None or entry["key"] != key:
+            return None
+        if entry["stdout"] != expect_files[stem].read_text():
+            return None
+        result = Result(stem, stdout=entry["stdout"], cached=True)
+        result.print(entry["stdout"], end="")
+        result.print(f"  - cached (took {entry['details']} when last run)")
+        return result
+
+    def store(self, result: Result) -> None:
+        if result.retval or result.cached or result.stem not in self.keys:
+            return
+        self.entries[result.stem] = {
+            "key": self.keys[result.stem],
+            "stdout": result.stdout,
+            "details": result.details,
+        }
+
+    def save(self) -> None:
+        self.path.write_text(json.dumps(self.entries, indent=2) + "\n")
+
+
+def summarize(results: list[Result], elapsed: float) -> None:
+    phases = [p for p in PHASES if any(p in r.phases for r in results)]
+    stats = any(len(r.samples) > 1 for r in results)
+    columns = [*phases, "total"] + (["min", "median", "stdev"] if stats else [])
+    print("--- Summary ---")
+    print("  Day", *(f"{c:>8}" for c in columns))
+    for result in results:
+        if result.cached:
+            print(f"  #{result.stem}", f"{'(cached)':>8}")
+        if result.duration is None:
+            continue
+        cells = [result.phases.get(p) for p in phases] + [result.duration]
+        if stats:
+            cells += sample_stats(result.samples).values()
+        print(
+            f"  #{result.stem}",
+            *("       -" if t is None else f"{t:7.02f}s" for t in cells),
+        )
+    busy = sum(r.duration for r in results if r.duration is not None)
+    print(f"  Total: {elapsed:.02f}s elapsed, {busy:.02f}s across all days")
+    if any(r.peak_traced for r in results):
+        summarize_memory(results)
+    if any(r.imports for r in results):
+        summarize_imports(results)
+    if any(r.caches for r in results):
+        summarize_caches(results)
+    if any(r.counters for r in results):
+        summarize_counters(results)
+
+
+def summarize_imports(results: list[Result]) -> None:
+    print("--- Slowest imports ---")
+    for result in results:
+        if not result.imports:
+            continue
+        slowest = sorted(result.imports.items(), key=lambda kv: -kv[1])[:3]
+        print(
+            f"  #{result.stem}",
+            ", ".join(f"{name} {t:.03f}s" for name, t in slowest),
+        )
+    slow = [
+        r
+        for r in results
+        if r.phases.get("import", 0) - r.phases.get("solve", 0) > NOISE_FLOOR
+    ]
+    for result in slow:
+        print(
+            f"*** Day #{result.stem} spends more time importing"
+            f" ({result.phases['import']:.02f}s) than solving"
+            f" ({result.phases['solve']:.02f}s)"
+        )
+
+
+def summarize_caches(results: list[Result]) -> None:
+    print("--- Memoization caches ---")
+    print(
+        "  Day  function            ",
+        *(f"{c:>9}" for c in ["hits", "misses", "hit rate", "size/max"]),
+        *(f"{c:>9}" for c in ["peak", "evictions"]),
+    )
+    for result in results:
+        for name, info in result.caches.items():
+            bound = "-" if info.maxsize is None else info.maxsize
+            print(
+                f"  #{result.stem}  {name:20}",
+                f"{info.hits:9}",
+                f"{info.misses:9}",
+                f"{info.hit_rate:9.1%}",
+                f"{f'{info.size}/{bound}':>9}",
+                f"{info.peak:9}",
+                f"{info.evictions:9}",
+            )
+
+
+def summarize_counters(results: list[Result]) -> None:
+    print("--- Counters ---")
+    for result in results:
+        for name, count in result.counters.items():
+            print(f"  #{result.stem}  {name:30} {count:12}")
+
+
+def summarize_memory(results: list[Result]) -> None:
+    phases = [p for p in PHASES if any(p in r.peak_traced for r in results)]
+    print("--- Peak memory (MB traced / MB RSS) ---")
+    print("  Day", *(f"{p:>15}" for p in phases))
+    for result in results:
+        if not result.peak_traced:
+            continue
+        cells = [
+            (result.peak_traced.get(p), result.peak_rss.get(p)) for p in phases
+        ]
+        print(
+            f"  #{result.stem}",
+            *(
+                "              -"
+                if traced is None or rss is None
+                else f"{traced / 2**20:7.01f}/{rss / 2**20:7.01f}"
+                for traced, rss in cells
+            ),
+        )
+
+
+def write_json(path: Path, results: list[Result]) -> None:
+    data = {
+        result.stem: {**result.phases, "total": result.duration}
+        | (
+            {"peak_traced": result.peak_traced, "peak_rss": result.peak_rss}
+            if result.peak_traced
+            else {}
+        )
+        for result in results
+        if result.duration is not None
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def git_revision() -> str:
     try:
-        proc = subprocess.run(
-            [sys.executable, script],  # noqa: S603
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],  # noqa: S607
             capture_output=True,
             text=True,
             check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def append_history(path: Path, results: list[Result], options: Options) -> None:
+    """Append benchmark results to the history file, keyed by git revision."""
+    history = json.loads(path.read_text()) if path.exists() else {}
+    history.setdefault(git_revision(), []).append(
+        {
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "warmup": options.warmup,
+            "repeat": options.repeat,
+            "days": {
+                result.stem: {
+                    **sample_stats(result.samples),
+                    "phases": result.phases,
+                }
+                | (
+                    {
+                        "peak_traced": result.peak_traced,
+                        "peak_rss": result.peak_rss,
+                    }
+                    if result.peak_traced
+                    else {}
+                )
+                for result in results
+                if result.samples
+            },
+        }
+    )
+    path.write_text(json.dumps(history, indent=2) + "\n")
+
+
+def check_baseline(
+    path: Path, results: list[Result], tolerance: float
+) -> list[str]:
+    """Compare medians and peak memory against the baseline.
+
+    A day has regressed if its median is more than `tolerance` (relative)
+    slower than the baseline median. Differences below NOISE_FLOOR are
+    ignored, as the fastest days are dominated by measurement noise.
+
+    If both the baseline and this run have recorded the peak traced memory,
+    it is held to the same tolerance (with MEMORY_NOISE_FLOOR). Peak RSS is
+    too dependent on the interpreter and allocator to be compared.
+    """
+    baseline = json.loads(path.read_text())
+    regressions = []
+    for result in results:
+        if not result.samples or result.stem not in baseline:
+            continue
+        before = baseline[result.stem]["median"]
+        after = statistics.median(result.samples)
+        if after > before * (1 + tolerance) and after - before > NOISE_FLOOR:
+            regressions.append(
+                f"#{result.stem}: {before:.03f}s -> {after:.03f}s"
+                f" ({after / before - 1:+.0%})"
+            )
+        before = baseline[result.stem].get("peak_traced")
+        if before is None or not result.peak_traced:
+            continue
+        after = max(result.peak_traced.values())
+        if (
+            after > before * (1 + tolerance)
+            and after - before > MEMORY_NOISE_FLOOR
+        ):
+            regressions.append(
+                f"#{result.stem}: {before / 2**20:.01f}MB"
+                f" -> {after / 2**20:.01f}MB ({after / before - 1:+.0%})"
+            )
+    return regressions
+
+
+def write_baseline(path: Path, results: list[Result]) -> None:
+    """Record median timings (and peak traced memory, if measured)."""
+    baseline = json.loads(path.read_text()) if path.exists() else {}
+    for result in results:
+        if not result.samples:
+            continue
+        entry = baseline.setdefault(result.stem, {})
+        entry["median"] = round(statistics.median(result.samples), 4)
+        if result.peak_traced:
+            entry["peak_traced"] = max(result.peak_traced.values())
+    path.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + "\n")
+
+
+def fit_exponent(sizes: list[int], values: list[float]) -> float | None:
+    """Return k in value ~ size^k, by least squares fit in log-log space."""
+    points = [
+        (math.log(size), math.log(value))
+        for size, value in zip(sizes, values, strict=True)
+        if value > 0
+    ]
+    if len({x for x, _ in points}) < 2:
+        return None
+    return statistics.linear_regression(*zip(*points, strict=True)).slope
+
+
+def sweep(stem: str, sizes: list[int], seed: int) -> int:
+    """Run the given day on synthetic inputs of increasing size.
+
+    For each size, time the phases once, and then run them once more under
+    tracemalloc to find the peak memory use (tracing slows things down, so it
+    is not done during the timed run). Finally, print the empirical
+    complexity exponents for time and memory across the sweep.
+    """
+    generator = GENERATORS[stem]
+    print(f"--- Sweep day #{stem} (size: {generator.unit}) ---")
+    print(
+        f"  {'size':>8}", *(f"{c:>8}" for c in [*SOLVE_PHASES, "total"]), end=""
+    )
+    print(f" {'peak mem':>10} {'exponent':>8}")
+    day = load_day(py_files[stem])
+    totals: list[float] = []
+    peaks: list[float] = []
+    for size in sizes:
+        text = generate(stem, size, seed)
+        timings: dict[str, float] = {}
+        try:
+            run_phases(day, text, timings)
+            tracemalloc.start()
+            run_phases(day, text, {})
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        except Exception:  # noqa: BLE001
+            print("*** EXCEPTION ***")
+            print(traceback.format_exc(), end="")
+            print("*****************")
+            return 4
+        finally:
+            tracemalloc.stop()
+        totals.append(sum(timings.values()))
+        slope = fit_exponent(sizes[: len(totals)][-2:], totals[-2:])
+        print(
+            f"  {size:8}",
+            *(
+                "       -" if p not in timings else f"{timings[p]:7.03f}s"
+                for p in SOLVE_PHASES
+            ),
+            f"{totals[-1]:7.03f}s",
+            f"{peaks[-1] / 2**20:8.02f}MB",
+            "       -" if slope is None else f"{slope:8.02f}",
         )
-    except subprocess.CalledProcessError as e:
-        print("*** STDOUT ***")
-        print(e.stdout, end="")
-        print("*** STDERR ***")
-        print(e.stderr, end="")
-        print("**************")
-        raise
-    t_end = time.monotonic()
-    if proc.stdout != expect:
-        print(f"*** Test failed for day #{stem}!")
-        print(f"    EXPECTED: {expect!r}")
-        print(f"     BUT GOT: {proc.stdout!r}")
-        return 1
-    print(proc.stdout, end="")
-    print(f"  - took {t_end - t_start:.02f}s")
+    time_exp = fit_exponent(sizes, totals)
+    mem_exp = fit_exponent(sizes, peaks)
+    if time_exp is not None and mem_exp is not None:
+        print(f"  Time ~ size^{time_exp:.02f}, memory ~ size^{mem_exp:.02f}")
     return 0
 
 
-if len(sys.argv) >= 2:
-    stems = sys.argv[1:]
-else:
-    stems = sorted(py_files.keys() | expect_files.keys())
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Test AoC solutions.")
+    parser.add_argument(
+        "stems",
+        nargs="*",
+        metavar="DAY",
+        help="days to test (default: all)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of days to run in parallel (0: one per CPU)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="import each day and time its parse/part1/part2 phases separately",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"rerun all days, even those with a cached result in {CACHE_FILE}",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help=f"run in process, reusing parsed inputs from {PARSE_CACHE_DIR}",
+    )
+    parser.add_argument(
+        "--importtime",
+        action="store_true",
+        help="run each day with -X importtime, and report its import costs",
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="run in process, and report statistics for memoized functions",
+    )
+    parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="run in process, and report work counted by aoc.counters",
+    )
+    parser.add_argument(
+        "--json",
+        type=Path,
+        metavar="FILE",
+        help="write per-day (and per-phase, if --in-process) timings to FILE",
+    )
+    profiling = parser.add_argument_group("profiling")
+    profiling.add_argument(
+        "--profile",
+        action="store_true",
+        help="run each day in process under cProfile, and save the profile",
+    )
+    profiling.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=Path("profiles"),
+        metavar="DIR",
+        help="write .pstats and .collapsed files to DIR (default: %(default)s)",
+    )
+    profiling.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        metavar="N",
+        help="print the N most expensive functions (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also measure peak traced memory and peak RSS per phase"
+        " (in process, costs two extra runs per day)",
+    )
+    bench = parser.add_argument_group("benchmarking")
+    bench.add_argument(
+        "--bench",
+        action="store_true",
+        help="run each day in process repeatedly, and report statistics",
+    )
+    bench.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="untimed runs per day before benchmarking (default: %(default)s)",
+    )
+    bench.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="timed runs per day when benchmarking (default: %(default)s)",
+    )
+    bench.add_argument(
+        "--history",
+        type=Path,
+        default=Path("bench-history.json"),
+        metavar="FILE",
+        help="append benchmark results to FILE (default: %(default)s)",
+    )
+    bench.add_argument(
+        "--baseline",
+        type=Path,
+        metavar="FILE",
+        help="fail if any day's median regressed compared to FILE",
+    )
+    bench.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="allowed relative slowdown vs. baseline (default: %(default)s)",
+    )
+    bench.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="write this run's medians to the --baseline FILE instead",
+    )
+    scaling = parser.add_argument_group("scaling")
+    scaling.add_argument(
+        "--sweep",
+        action="store_true",
+        help="run each day on synthetic inputs of increasing size",
+    )
+    scaling.add_argument(
+        "--sizes",
+        type=lambda s: [int(n) for n in s.split(",")],
+        metavar="N,N,...",
+        help="input sizes for --sweep (default: per-day sizes)",
+    )
+    scaling.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="random seed for generated inputs (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    if args.importtime and (
+        args.in_process
+        or args.bench
+        or args.profile
+        or args.memory
+        or args.parse_cache
+        or args.cache_stats
+        or args.counters
+    ):
+        parser.error("--importtime needs to run days as subprocesses")
+    if args.profile and args.bench:
+        parser.error("--profile cannot be combined with --bench")
+    if args.sizes and not args.sweep:
+        parser.error("--sizes requires --sweep")
+    if (args.baseline or args.update_baseline) and not args.bench:
+        parser.error("--baseline/--update-baseline require --bench")
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline requires --baseline FILE")
+    return args
+
+
+def finish(args: argparse.Namespace, results: list[Result]) -> int:
+    """Write/check benchmark results after all days have passed."""
+    if args.json:
+        write_json(args.json, results)
+    if not args.bench:
+        return 0
+    append_history(args.history, results, options_from(args))
+    if args.update_baseline:
+        write_baseline(args.baseline, results)
+    elif args.baseline:
+        regressions = check_baseline(args.baseline, results, args.tolerance)
+        if regressions:
+            print(
+                f"*** Performance regressions (tolerance {args.tolerance:.0%}):"
+            )
+            for regression in regressions:
+                print(f"    {regression}")
+            return 5
+    return 0
+
+
+def options_from(args: argparse.Namespace) -> Options:
+    if args.profile:
+        return Options(
+            in_process=True,
+            profile_dir=args.profile_dir,
+            profile_top=args.top,
+            memory=args.memory,
+            parse_cache=args.parse_cache,
+            cache_stats=args.cache_stats,
+            counters=args.counters,
+        )
+    if args.bench:
+        return Options(
+            in_process=True,
+            warmup=args.warmup,
+            repeat=max(1, args.repeat),
+            memory=args.memory,
+            parse_cache=args.parse_cache,
+            cache_stats=args.cache_stats,
+            counters=args.counters,
+        )
+    if args.importtime:
+        return Options(importtime=True)
+    return Options(
+        in_process=(
+            args.in_process
+            or args.memory
+            or args.parse_cache
+            or args.cache_stats
+            or args.counters
+        ),
+        memory=args.memory,
+        parse_cache=args.parse_cache,
+        cache_stats=args.cache_stats,
+        counters=args.counters,
+    )
+
+
+def schedule(
+    pool: Pool,
+    stems: list[str],
+    options: Options,
+    cache: ResultCache | None,
+) -> list[Callable[[], Result]]:
+    """Start testing days that are not cached, return how to get results."""
+
+    def cached(result: Result) -> Callable[[], Result]:
+        return lambda: result
+
+    pending = []
+    for stem in stems:
+        if cache is not None and (hit := cache.lookup(stem)) is not None:
+            pending.append(cached(hit))
+        else:
+            pending.append(pool.apply_async(test, (stem, options)).get)
+    return pending
+
+
+def main() -> int:
+    args = parse_args()
+    stems = args.stems or sorted(py_files.keys() | expect_files.keys())
+    jobs = args.jobs or os.cpu_count() or 1
+    options = options_from(args)
+    if args.sweep:
+        for stem in stems:
+            if stem in GENERATORS:
+                sizes = args.sizes or GENERATORS[stem].sizes
+                if retval := sweep(stem, sorted(sizes), args.seed):
+                    return retval
+        return 0
+
+    t_start = time.monotonic()
+    results: list[Result] = []
+    # Days run as subprocesses only need threads to wait for them. Days run in
+    # process can share one interpreter, unless we want them to run in parallel
+    use_processes = options.in_process and jobs > 1
+    # Only plain test runs use the cache, as other modes want measurements
+    measuring = (
+        args.bench
+        or args.profile
+        or args.memory
+        or args.importtime
+        or args.cache_stats
+        or args.counters
+        or args.json
+        or args.parse_cache
+    )
+    cache = None if args.no_cache or measuring else ResultCache(CACHE_FILE)
+    with (Pool if use_processes else ThreadPool)(jobs) as pool:
+        pending = schedule(pool, stems, options, cache)
+        try:
+            for get_result in pending:  # report in day order
+                results.append(get_result())
+                if cache is not None:
+                    cache.store(results[-1])
+                if retval := results[-1].report():
+                    return retval
+        finally:
+            subprocesses.kill_all()  # pool.terminate() does not kill these
+            if cache is not None:
+                cache.save()
+    summarize(results, time.monotonic() - t_start)
+    return finish(args, results)
+
 
-for stem in stems:
-    if retval := test(stem):
-        sys.exit(retval)
+if __name__ == "__main__":
+    sys.exit(main())